@@ -0,0 +1,34 @@
+"""index view foreign keys
+
+Listing the snapshots of a view filters view_snapshots by view_id, and finding
+the views that contain a repository filters view_repositories by
+repository_id. Neither column was indexed (view_repositories.view_id is
+already covered by uq_view_repository), so both lookups scanned the table.
+
+Revision ID: c3d4e5f6a7b8
+Revises: b1c2d3e4f5a6
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d4e5f6a7b8"
+down_revision: str | None = "b1c2d3e4f5a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_view_snapshots_view_id"), "view_snapshots", ["view_id"])
+    op.create_index(
+        op.f("ix_view_repositories_repository_id"), "view_repositories", ["repository_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_view_repositories_repository_id"), table_name="view_repositories")
+    op.drop_index(op.f("ix_view_snapshots_view_id"), table_name="view_snapshots")
@@ -0,0 +1,58 @@
+"""store view_snapshots.snapshot_ids as JSONB on PostgreSQL
+
+The text-based ``json`` type is re-parsed on every read and cannot be indexed.
+On PostgreSQL convert the column to binary ``jsonb`` and add a GIN index so
+"which view snapshots include snapshot X" containment lookups (``@>``) use the
+index. Other backends keep their generic JSON column and are not touched.
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: str | None = "c3d4e5f6a7b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "view_snapshots",
+        "snapshot_ids",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="snapshot_ids::jsonb",
+    )
+    op.create_index(
+        "ix_view_snapshots_snapshot_ids",
+        "view_snapshots",
+        ["snapshot_ids"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_view_snapshots_snapshot_ids", table_name="view_snapshots")
+    op.alter_column(
+        "view_snapshots",
+        "snapshot_ids",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="snapshot_ids::json",
+    )
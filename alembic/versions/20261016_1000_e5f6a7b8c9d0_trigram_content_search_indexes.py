@@ -0,0 +1,63 @@
+"""trigram indexes for content search on PostgreSQL
+
+``chantal content search`` matches ``ILIKE '%query%'`` against name and
+version. A leading wildcard cannot use a btree index, so every search scanned
+the whole content_items table. On PostgreSQL add ``pg_trgm`` GIN indexes on
+both columns, which the planner uses for infix ``ILIKE`` patterns.
+
+Creating the extension needs the CREATE privilege on the database; if that is
+not available the indexes are skipped and search keeps working without them.
+Other backends are not touched.
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+import logging
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9d0"
+down_revision: str | None = "d4e5f6a7b8c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    # Try the extension in a savepoint so a missing privilege doesn't abort
+    # the surrounding migration transaction.
+    bind = op.get_bind()
+    try:
+        with bind.begin_nested():
+            bind.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except sa.exc.DBAPIError:
+        logger.warning("pg_trgm extension not available; skipping content search trigram indexes")
+        return
+
+    for column in ("name", "version"):
+        op.create_index(
+            f"ix_content_items_{column}_trgm",
+            "content_items",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    # The extension is left installed; other objects may depend on it.
+    for column in ("name", "version"):
+        op.drop_index(f"ix_content_items_{column}_trgm", table_name="content_items", if_exists=True)
@@ -6,9 +6,27 @@ This script fixes yamllint comment-indentation warnings by ensuring that
 comment lines within commented-out blocks have consistent indentation.
 """
 
+import os
+import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+
+# One match per line: leading spaces and the rest of the line.
+_LINE_RE = re.compile(r"^( *)([^\n]*)", re.MULTILINE)
+
+# An indented bare "#" line; outside list items these are the only lines
+# that get rewritten (back to column 0).
+_INDENTED_BARE_COMMENT_RE = re.compile(r"^ +#[^\S\n]*$", re.MULTILINE)
+
+# Precomputed indentation strings, covering realistic YAML nesting depths
+_PREFIXES = tuple(" " * i for i in range(64))
+
+
+def _indent(width: int) -> str:
+    """Return a string of ``width`` spaces, reusing the precomputed ones."""
+    return _PREFIXES[width] if width < len(_PREFIXES) else " " * width
 
 
 def format_yaml_file(file_path: Path) -> bool:
@@ -19,6 +37,9 @@ def format_yaml_file(file_path: Path) -> bool:
     Within list items (starting with -), comments should be indented to match
     the list content (usually 2 spaces).
 
+    Lines are scanned with a single compiled regex; only the spans that need
+    fixing are rewritten, and the file is left untouched when nothing changed.
+
     Args:
         file_path: Path to the YAML file to format
 
@@ -26,107 +47,112 @@ def format_yaml_file(file_path: Path) -> bool:
         True if file was modified, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        text = file_path.read_text(encoding="utf-8")
+
+        # Without any list item there is no comment context to fix; skip the
+        # line scan unless a bare "#" separator needs pulling back to column 0
+        if "- " not in text and not _INDENTED_BARE_COMMENT_RE.search(text):
+            return False
 
-        modified = False
-        result_lines = []
+        pieces = []
+        last = 0
 
         # Track the current indentation context
         expected_comment_indent = 0
 
-        for i, line in enumerate(lines):
-            stripped = line.lstrip(' ')
-            indent = len(line) - len(stripped)
+        for match in _LINE_RE.finditer(text):
+            leading, stripped = match.groups()
+            indent = len(leading)
 
             # Detect list item markers (- id:, - name:, etc.)
-            if stripped.startswith('- '):
-                # Start of a list item - set expected comment indent
-                expected_comment_indent = indent + 2  # Comments within item should be +2
-                result_lines.append(line)
+            if stripped.startswith("- "):
+                # Start of a list item - comments within the item should be +2
+                expected_comment_indent = indent + 2
                 continue
 
-            # Detect when we leave a list item context (back to root level non-comment)
-            if indent == 0 and stripped and not stripped.startswith('#'):
-                expected_comment_indent = 0
-
-            # Handle comment lines
-            if stripped.startswith('#'):
-                # Standalone # line (empty comment separator)
-                if stripped.strip() == '#':
-                    # These should match the surrounding context
-                    proper_indent = expected_comment_indent if expected_comment_indent > 0 else 0
-
-                    if indent != proper_indent:
-                        fixed_line = ' ' * proper_indent + '#\n'
-                        result_lines.append(fixed_line)
-                        modified = True
-                        continue
-
-                # Comment with content - check if it's part of a list item
-                elif expected_comment_indent > 0 and indent < expected_comment_indent:
-                    # This comment is under-indented relative to the list item
-                    # Fix it by adding proper indentation
-                    fixed_line = ' ' * expected_comment_indent + stripped
-                    result_lines.append(fixed_line)
-                    modified = True
-                    continue
-
-                result_lines.append(line)
-            else:
-                result_lines.append(line)
-
-        if modified:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(result_lines)
-            return True
+            if not stripped.startswith("#"):
+                # Detect when we leave a list item context (back to root level
+                # content or a blank line)
+                if indent == 0:
+                    expected_comment_indent = 0
+                continue
 
-        return False
+            # Standalone # line (empty comment separator) - match the context
+            if stripped.strip() == "#":
+                if indent != expected_comment_indent:
+                    pieces.append(text[last : match.start()])
+                    pieces.append(_indent(expected_comment_indent) + "#")
+                    last = match.end()
+
+            # Comment with content under-indented relative to the list item
+            elif expected_comment_indent > 0 and indent < expected_comment_indent:
+                pieces.append(text[last : match.start()])
+                pieces.append(_indent(expected_comment_indent))
+                last = match.start(2)
+
+        if not pieces:
+            return False
+
+        pieces.append(text[last:])
+        file_path.write_text("".join(pieces), encoding="utf-8")
+        return True
 
     except Exception as e:
         print(f"Error processing {file_path}: {e}", file=sys.stderr)
         return False
 
 
-def find_yaml_files(directories: List[str]) -> List[Path]:
+def iter_yaml_files(directories: list[str]) -> Iterator[Path]:
     """
-    Find all YAML files in the specified directories.
+    Yield all YAML files in the specified directories as they are found.
+
+    Directories and file names are visited in sorted order, so the output is
+    deterministic without collecting and sorting the full list first.
 
     Args:
         directories: List of directory paths to search
 
-    Returns:
-        List of Path objects for YAML files
+    Yields:
+        Path objects for YAML files
     """
-    yaml_files = []
     for directory in directories:
-        dir_path = Path(directory)
-        if dir_path.exists() and dir_path.is_dir():
-            yaml_files.extend(dir_path.rglob('*.yaml'))
-            yaml_files.extend(dir_path.rglob('*.yml'))
-    return sorted(yaml_files)
+        # Single traversal per directory, matching both suffixes at once
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith((".yaml", ".yml")):
+                    yield Path(root) / name
+
+
+def _format_one(file_path: Path) -> tuple[Path, bool]:
+    """Format one file in a worker and report which file it was."""
+    return file_path, format_yaml_file(file_path)
 
 
 def main() -> int:
     """Main entry point."""
     # Directories to process
-    directories = ['examples', '.dev', '.github']
+    directories = ["examples", ".dev", ".github"]
 
-    print("Finding YAML files...")
-    yaml_files = find_yaml_files(directories)
+    print("Finding YAML files...\n")
 
-    if not yaml_files:
+    # Files are independent, so format them across all cores; paths are fed
+    # to the pool while the directory walk is still in progress
+    found_count = 0
+    modified_count = 0
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(_format_one, iter_yaml_files(directories), chunksize=16)
+        for yaml_file, modified in results:
+            found_count += 1
+            if modified:
+                print(f"✓ Formatted: {yaml_file}")
+                modified_count += 1
+
+    if not found_count:
         print("No YAML files found.")
         return 0
 
-    print(f"Found {len(yaml_files)} YAML files\n")
-
-    modified_count = 0
-    for yaml_file in yaml_files:
-        if format_yaml_file(yaml_file):
-            print(f"✓ Formatted: {yaml_file}")
-            modified_count += 1
-
+    print(f"\nChecked {found_count} YAML files")
     if modified_count > 0:
         print(f"\n✓ Formatted {modified_count} file(s)")
     else:
@@ -135,5 +161,5 @@ def main() -> int:
     return 0
 
 
-if __name__ == '__main__':
+if __name__ == "__main__":
     sys.exit(main())
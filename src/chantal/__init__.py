@@ -8,15 +8,9 @@ Red Hat Subscription authentication, content-addressed storage, and immutable
 snapshots.
 """
 
-__version__ = "1.6.5"
+from chantal._version import __version__
+
 __author__ = "Simon Lauger"
 __license__ = "MIT"
 
-# Make version accessible
-from importlib.metadata import version as _version
-
-try:
-    __version__ = _version("chantal")
-except Exception:
-    # Package not installed yet
-    pass
+__all__ = ["__version__"]
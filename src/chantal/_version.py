@@ -0,0 +1,3 @@
+"""Package version, kept in sync with ``pyproject.toml`` by semantic-release."""
+
+__version__ = "1.6.5"
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 """Cache management commands."""
 
+import os
+
 import click
 
-from chantal.core.cache import MetadataCache
 from chantal.core.config import GlobalConfig
 
 # Click context settings to enable -h as alias for --help
@@ -39,6 +40,8 @@ def create_cache_group(cli: click.Group) -> click.Group:
 
         By default, clears all cached metadata files.
         """
+        from chantal.core.cache import MetadataCache
+
         config: GlobalConfig = ctx.obj["config"]
 
         # Check if cache is configured
@@ -58,15 +61,15 @@ def create_cache_group(cli: click.Group) -> click.Group:
             enabled=True,
         )
 
-        # Get stats before clearing
-        stats = cache_manager.stats()
+        # Confirm action (with --force, skip the extra directory scan; clear()
+        # reports the freed space itself)
+        if not force:
+            stats = cache_manager.stats()
 
-        if stats.total_files == 0:
-            click.echo("Cache is already empty")
-            return
+            if stats.total_files == 0:
+                click.echo("Cache is already empty")
+                return
 
-        # Confirm action
-        if not force:
             size_mb = stats.total_size_bytes / (1024 * 1024)
             click.echo(f"About to delete {stats.total_files} cached file(s) ({size_mb:.2f} MB)")
             if not click.confirm("Continue?"):
@@ -78,8 +81,12 @@ def create_cache_group(cli: click.Group) -> click.Group:
             click.echo("Note: Per-repository clearing not yet implemented")
             click.echo("Clearing all cache entries instead...")
 
-        files_deleted = cache_manager.clear()
-        size_mb = stats.total_size_bytes / (1024 * 1024)
+        files_deleted, bytes_freed = cache_manager.clear()
+        if files_deleted == 0:
+            click.echo("Cache is already empty")
+            return
+
+        size_mb = bytes_freed / (1024 * 1024)
 
         click.echo()
         click.echo("✓ Cache cleared successfully!")
@@ -90,6 +97,8 @@ def create_cache_group(cli: click.Group) -> click.Group:
     @click.pass_context
     def cache_stats(ctx: click.Context) -> None:
         """Show cache statistics."""
+        from chantal.core.cache import MetadataCache
+
         config: GlobalConfig = ctx.obj["config"]
 
         # Check if cache is configured
@@ -162,10 +171,10 @@ def create_cache_group(cli: click.Group) -> click.Group:
             click.echo(f"Cache directory does not exist: {cache_path}")
             return
 
-        # List cache files
-        cache_files = sorted(
-            cache_path.glob("*.xml.gz"), key=lambda p: p.stat().st_mtime, reverse=True
-        )
+        # List cache files (DirEntry caches its stat(), so each file is stat'ed once)
+        with os.scandir(cache_path) as it:
+            cache_files = [entry for entry in it if entry.name.endswith(".xml.gz")]
+        cache_files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
 
         if not cache_files:
             click.echo("Cache is empty")
@@ -180,16 +189,15 @@ def create_cache_group(cli: click.Group) -> click.Group:
 
         now = time.time()
 
-        for i, cache_file in enumerate(cache_files):
-            if i >= limit:
-                break
-
+        # Rows are collected and written with a single echo
+        lines = []
+        for cache_file in cache_files[:limit]:
             stat = cache_file.stat()
             size_mb = stat.st_size / (1024 * 1024)
             age_hours = (now - stat.st_mtime) / 3600
 
             # Extract checksum from filename (format: {checksum}.xml.gz)
-            checksum = cache_file.stem  # Removes .xml.gz
+            checksum = cache_file.name[: -len(".xml.gz")]
 
             if size_mb >= 1.0:
                 size_str = f"{size_mb:.2f} MB"
@@ -208,7 +216,9 @@ def create_cache_group(cli: click.Group) -> click.Group:
             # Truncate checksum for display
             checksum_display = f"{checksum[:64]}..." if len(checksum) > 64 else checksum
 
-            click.echo(f"{checksum_display:<70} {size_str:>12} {age_str:>12}")
+            lines.append(f"{checksum_display:<70} {size_str:>12} {age_str:>12}")
+
+        click.echo("\n".join(lines))
 
         if len(cache_files) > limit:
             click.echo()
@@ -2,19 +2,67 @@ from __future__ import annotations
 
 """Content management commands."""
 
-import csv
-import json
-import sys
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
 
 import click
 
+from chantal.cli.options import output_format_option
 from chantal.core.config import GlobalConfig
-from chantal.db.connection import DatabaseManager
-from chantal.db.models import ContentItem, Repository, Snapshot
 
 # Click context settings to enable -h as alias for --help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+# Horizontal rule framing the detail views
+_RULE = "=" * 70
+
+# Rows fetched per round trip when streaming `content search` results
+_SEARCH_BATCH_SIZE = 1000
+
+# SHA256 identifier accepted by `content show` (either case)
+_SHA256_RE = re.compile(r"\A[0-9a-fA-F]{64}\Z")
+
+# LIKE metacharacters that must match literally in user search queries
+_LIKE_SPECIAL_RE = re.compile(r"([\\%_])")
+_WILDCARD_RUN_RE = re.compile(r"\*+")
+
+
+def _glob_to_like(query: str) -> str | None:
+    """Translate a `content search` query into an ILIKE pattern.
+
+    The query matches anywhere in the value; ``*`` is a wildcard. ``%``, ``_``
+    and ``\\`` are escaped so they match literally (use ``escape="\\"``).
+
+    Args:
+        query: Search query as typed by the user
+
+    Returns:
+        The LIKE pattern, or None if the query matches everything
+    """
+    if not query.strip("*"):
+        return None
+    escaped = _LIKE_SPECIAL_RE.sub(r"\\\1", query)
+    return f"%{_WILDCARD_RUN_RE.sub('%', escaped)}%"
+
+
+def _echo_json_array(rows: Iterable[dict[str, Any]]) -> None:
+    """Write rows to stdout as a JSON array, one element at a time.
+
+    The output is byte-for-byte what ``json.dumps(list(rows), indent=2)``
+    would produce, but only one row is held in memory as text at a time.
+
+    Args:
+        rows: JSON-serializable dicts to write
+    """
+    import json
+
+    opening = "[\n  "
+    for row in rows:
+        click.echo(opening + json.dumps(row, indent=2).replace("\n", "\n  "), nl=False)
+        opening = ",\n  "
+    click.echo("\n]" if opening != "[\n  " else "[]")
+
 
 def create_content_group(cli: click.Group) -> click.Group:
     """Create and return the content command group.
@@ -42,13 +90,7 @@ def create_content_group(cli: click.Group) -> click.Group:
         help="Filter by content type",
     )
     @click.option("--limit", type=int, default=100, help="Limit number of results")
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json", "csv"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option(csv=True)
     @click.pass_context
     def content_list(
         ctx: click.Context,
@@ -64,11 +106,19 @@ def create_content_group(cli: click.Group) -> click.Group:
         Shows content items from repository, snapshot, or view.
         Works with all content types: RPM, Helm, APT, etc.
         """
+        import csv
+        import io
+
+        from sqlalchemy import func
+
+        from chantal.db.connection import DatabaseManager
+        from chantal.db.models import ContentItem, Repository, Snapshot
+
         config: GlobalConfig = ctx.obj["config"]
         db_manager = DatabaseManager(config.database.url)
 
         # Validate scope (only one can be specified)
-        scope_count = sum([bool(repo_id), bool(snapshot_id), bool(view_name)])
+        scope_count = bool(repo_id) + bool(snapshot_id) + bool(view_name)
         if scope_count > 1:
             click.echo(
                 "Error: Only one of --repo-id, --snapshot-id, or --view can be specified.", err=True
@@ -76,8 +126,22 @@ def create_content_group(cli: click.Group) -> click.Group:
             ctx.exit(1)
 
         with db_manager.session() as session:
-            # Get content items based on scope
-            items = []
+            # Build the query for the requested scope; filtering and the limit
+            # run in SQL so only the rows that are shown get loaded. Only the
+            # displayed columns and metadata keys are selected, as plain rows.
+            metadata = ContentItem.content_metadata
+            items_query = session.query(
+                ContentItem.name,
+                ContentItem.version,
+                ContentItem.content_type,
+                ContentItem.size_bytes,
+                ContentItem.sha256,
+                metadata["arch"].as_string().label("arch"),
+                metadata["release"].as_string().label("release"),
+                metadata["app_version"].as_string().label("app_version"),
+                # Number of matches before LIMIT, in the same round trip
+                func.count().over().label("total"),
+            )
             scope_desc = "all content"
 
             if repo_id:
@@ -85,7 +149,7 @@ def create_content_group(cli: click.Group) -> click.Group:
                 if not repository:
                     click.echo(f"Error: Repository '{repo_id}' not found.", err=True)
                     ctx.exit(1)
-                items = list(repository.content_items)
+                items_query = items_query.filter(ContentItem.repositories.contains(repository))
                 scope_desc = f"repository '{repo_id}'"
 
             elif snapshot_id:
@@ -93,71 +157,66 @@ def create_content_group(cli: click.Group) -> click.Group:
                 if not snapshot:
                     click.echo(f"Error: Snapshot '{snapshot_id}' not found.", err=True)
                     ctx.exit(1)
-                items = list(snapshot.content_items)
+                items_query = items_query.filter(ContentItem.snapshots.contains(snapshot))
                 scope_desc = f"snapshot '{snapshot_id}'"
 
             elif view_name:
-                # Get all repos in view and collect their items
+                # Items from any of the repositories in the view
                 view_config = config.get_view(view_name)
                 if not view_config:
                     click.echo(f"Error: View '{view_name}' not found in config.", err=True)
                     ctx.exit(1)
-                for repo_id in view_config.repos:
-                    repo = session.query(Repository).filter_by(repo_id=repo_id).first()
-                    if repo:
-                        items.extend(repo.content_items)
+                items_query = items_query.filter(
+                    ContentItem.repositories.any(Repository.repo_id.in_(view_config.repos))
+                )
                 scope_desc = f"view '{view_name}'"
-            else:
-                # No scope - show all content
-                items = session.query(ContentItem).all()
 
             # Apply content type filter
             if content_type:
-                items = [item for item in items if item.content_type == content_type]
+                items_query = items_query.filter_by(content_type=content_type)
 
             # Apply limit
-            items = items[:limit]
+            items = items_query.limit(limit).all()
 
             # Output
             if output_format == "json":
-                result = []
-                for item in items:
-                    data = {
-                        "name": item.name,
-                        "version": item.version,
-                        "type": item.content_type,
-                        "size_bytes": item.size_bytes,
-                        "sha256": item.sha256,
-                    }
-                    # Add type-specific fields from metadata
-                    if item.content_metadata:
+
+                def json_rows() -> Iterator[dict[str, Any]]:
+                    for item in items:
+                        data = {
+                            "name": item.name,
+                            "version": item.version,
+                            "type": item.content_type,
+                            "size_bytes": item.size_bytes,
+                            "sha256": item.sha256,
+                        }
+                        # Add type-specific fields from metadata
                         if item.content_type == "rpm":
-                            data["arch"] = item.content_metadata.get("arch", "")
-                            data["release"] = item.content_metadata.get("release", "")
+                            data["arch"] = item.arch or ""
+                            data["release"] = item.release or ""
                         elif item.content_type == "helm":
-                            data["app_version"] = item.content_metadata.get("app_version")
-                    result.append(data)
-                click.echo(json.dumps(result, indent=2))
+                            data["app_version"] = item.app_version
+                        yield data
+
+                _echo_json_array(json_rows())
 
             elif output_format == "csv":
-                writer = csv.writer(sys.stdout)
+                # Format into memory and write once instead of once per row
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
                 writer.writerow(["Name", "Version", "Type", "Arch", "Size (bytes)", "SHA256"])
-                for item in items:
-                    arch = (
-                        item.content_metadata.get("arch", "-")
-                        if item.content_metadata and item.content_type == "rpm"
-                        else "-"
-                    )
-                    writer.writerow(
-                        [
-                            item.name,
-                            item.version,
-                            item.content_type,
-                            arch,
-                            item.size_bytes,
-                            item.sha256,
-                        ]
+                writer.writerows(
+                    (
+                        item.name,
+                        item.version,
+                        item.content_type,
+                        (item.arch or "-") if item.content_type == "rpm" else "-",
+                        item.size_bytes,
+                        item.sha256,
                     )
+                    for item in items
+                )
+                click.echo(buffer.getvalue(), nl=False)
 
             else:
                 # Table format
@@ -171,9 +230,12 @@ def create_content_group(cli: click.Group) -> click.Group:
                     click.echo("  No content found.")
                     return
 
-                # Determine if we have mixed types
-                types_present = {item.content_type for item in items}
-                has_arch = "rpm" in types_present
+                # Show the Arch column if any RPMs are listed; a --type filter
+                # already answers that without looking at the rows
+                if content_type:
+                    has_arch = content_type == "rpm"
+                else:
+                    has_arch = any(item.content_type == "rpm" for item in items)
 
                 # Dynamic column headers
                 if has_arch:
@@ -185,11 +247,13 @@ def create_content_group(cli: click.Group) -> click.Group:
                     click.echo(f"{'Name':<35} {'Version':<20} {'Type':<6} {'Size':>12}")
                     click.echo("-" * 81)
 
+                # Rows are collected and written with a single echo
+                lines = []
                 for item in items:
                     # Get arch from metadata if RPM
                     arch = "-"
-                    if item.content_type == "rpm" and item.content_metadata:
-                        arch = item.content_metadata.get("arch", "-")
+                    if item.content_type == "rpm":
+                        arch = item.arch or "-"
 
                     # Format size
                     size_mb = item.size_bytes / (1024**2)
@@ -203,16 +267,20 @@ def create_content_group(cli: click.Group) -> click.Group:
                     name = item.name[:33] + ".." if len(item.name) > 35 else item.name
 
                     if has_arch:
-                        click.echo(
+                        lines.append(
                             f"{name:<35} {item.version:<20} {item.content_type:<6} {arch:<10} {size_str:>12}"
                         )
                     else:
-                        click.echo(
+                        lines.append(
                             f"{name:<35} {item.version:<20} {item.content_type:<6} {size_str:>12}"
                         )
 
-                click.echo()
-                click.echo(f"Total: {len(items)} item(s)")
+                click.echo("\n".join(lines))
+                total = items[0].total
+                if total > len(items):
+                    click.echo(f"\nTotal: {len(items)} of {total} item(s)")
+                else:
+                    click.echo(f"\nTotal: {len(items)} item(s)")
 
     @content.command("search")
     @click.argument("query")
@@ -225,13 +293,8 @@ def create_content_group(cli: click.Group) -> click.Group:
         type=click.Choice(["rpm", "helm", "apt"]),
         help="Filter by content type",
     )
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option()
+    @click.option("--limit", type=int, default=100, help="Limit number of results")
     @click.pass_context
     def content_search(
         ctx: click.Context,
@@ -241,17 +304,23 @@ def create_content_group(cli: click.Group) -> click.Group:
         view_name: str,
         content_type: str,
         output_format: str,
+        limit: int,
     ) -> None:
         """Search for content by name or version.
 
         Searches globally across all repositories by default.
         Supports case-insensitive pattern matching.
         """
+        from sqlalchemy.orm import selectinload
+
+        from chantal.db.connection import DatabaseManager
+        from chantal.db.models import ContentItem, Repository, Snapshot
+
         config: GlobalConfig = ctx.obj["config"]
         db_manager = DatabaseManager(config.database.url)
 
         # Validate scope (only one can be specified)
-        scope_count = sum([bool(repo_id), bool(snapshot_id), bool(view_name)])
+        scope_count = bool(repo_id) + bool(snapshot_id) + bool(view_name)
         if scope_count > 1:
             click.echo(
                 "Error: Only one of --repo-id, --snapshot-id, or --view can be specified.", err=True
@@ -259,8 +328,9 @@ def create_content_group(cli: click.Group) -> click.Group:
             ctx.exit(1)
 
         with db_manager.session() as session:
-            # Build base query
-            items_query = session.query(ContentItem)
+            # Build base query; repositories are shown per item, so load them
+            # for all results in one extra query instead of one per item
+            items_query = session.query(ContentItem).options(selectinload(ContentItem.repositories))
 
             # Filter by scope
             scope_desc = "all repositories"
@@ -285,50 +355,59 @@ def create_content_group(cli: click.Group) -> click.Group:
                 if not view_config:
                     click.echo(f"Error: View '{view_name}' not found.", err=True)
                     ctx.exit(1)
-                # Get all repos in view
-                repo_ids = view_config.repos
-                repos = session.query(Repository).filter(Repository.repo_id.in_(repo_ids)).all()
-                # Filter by any of these repositories
-                if repos:
-                    items_query = items_query.filter(
-                        ContentItem.repositories.any(Repository.repo_id.in_(repo_ids))
-                    )
+                # Filter by any of the view's repositories
+                items_query = items_query.filter(
+                    ContentItem.repositories.any(Repository.repo_id.in_(view_config.repos))
+                )
                 scope_desc = f"view '{view_name}'"
 
-            # Apply name/version search (case-insensitive)
-            search_pattern = query.replace("*", "%")
-            items_query = items_query.filter(
-                (ContentItem.name.ilike(f"%{search_pattern}%"))
-                | (ContentItem.version.ilike(f"%{search_pattern}%"))
-            )
+            # Apply name/version search (case-insensitive); a query that is
+            # only wildcards matches everything and needs no filter
+            search_pattern = _glob_to_like(query)
+            if search_pattern is not None:
+                items_query = items_query.filter(
+                    ContentItem.name.ilike(search_pattern, escape="\\")
+                    | ContentItem.version.ilike(search_pattern, escape="\\")
+                )
 
             # Filter by content type if specified
             if content_type:
                 items_query = items_query.filter_by(content_type=content_type)
 
-            # Get results
-            items = items_query.all()
+            # Get results; rows are consumed in batches instead of being
+            # collected into a list first (nothing here modifies them)
+            items = items_query.limit(limit).yield_per(_SEARCH_BATCH_SIZE)
 
             if output_format == "json":
-                result = []
-                for item in items:
-                    # Get repository names for this item
-                    repo_names = [repo.repo_id for repo in item.repositories]
-                    data = {
-                        "name": item.name,
-                        "version": item.version,
-                        "type": item.content_type,
-                        "size_bytes": item.size_bytes,
-                        "sha256": item.sha256,
-                        "repositories": repo_names,
-                    }
-                    # Add type-specific fields
-                    if item.content_metadata:
-                        if item.content_type == "rpm":
-                            data["arch"] = item.content_metadata.get("arch", "")
-                            data["release"] = item.content_metadata.get("release", "")
-                    result.append(data)
-                click.echo(json.dumps(result, indent=2))
+                returned = 0
+
+                def json_rows() -> Iterator[dict[str, Any]]:
+                    nonlocal returned
+                    for item in items:
+                        returned += 1
+                        # Get repository names for this item
+                        repo_names = [repo.repo_id for repo in item.repositories]
+                        data = {
+                            "name": item.name,
+                            "version": item.version,
+                            "type": item.content_type,
+                            "size_bytes": item.size_bytes,
+                            "sha256": item.sha256,
+                            "repositories": repo_names,
+                        }
+                        # Add type-specific fields
+                        if item.content_metadata:
+                            if item.content_type == "rpm":
+                                data["arch"] = item.content_metadata.get("arch", "")
+                                data["release"] = item.content_metadata.get("release", "")
+                        yield data
+
+                _echo_json_array(json_rows())
+                # On stderr, so the JSON on stdout stays parseable
+                if returned == limit:
+                    click.echo(
+                        f"Showing the first {limit} matches. Use --limit to show more.", err=True
+                    )
             else:
                 # Table format
                 click.echo(f"Searching for: '{query}' in {scope_desc}")
@@ -336,17 +415,15 @@ def create_content_group(cli: click.Group) -> click.Group:
                     click.echo(f"Content type: {content_type}")
                 click.echo()
 
-                if not items:
-                    click.echo("  No content found.")
-                    click.echo("  Try broadening your search query.")
-                    return
-
-                click.echo(
-                    f"{'Repository':<25} {'Name':<30} {'Version':<15} {'Type':<6} {'Size':>10}"
-                )
-                click.echo("-" * 93)
-
+                found = 0
                 for item in items:
+                    if not found:
+                        click.echo(
+                            f"{'Repository':<25} {'Name':<30} {'Version':<15} {'Type':<6} {'Size':>10}"
+                        )
+                        click.echo("-" * 93)
+                    found += 1
+
                     # Get first repository (for display)
                     repo_names = [repo.repo_id for repo in item.repositories]
                     repo_display = repo_names[0] if repo_names else "(none)"
@@ -368,18 +445,19 @@ def create_content_group(cli: click.Group) -> click.Group:
                         f"{repo_display:<25} {name:<30} {item.version:<15} {item.content_type:<6} {size_str:>10}"
                     )
 
+                if not found:
+                    click.echo("  No content found.")
+                    click.echo("  Try broadening your search query.")
+                    return
+
                 click.echo()
-                click.echo(f"Found: {len(items)} item(s)")
+                click.echo(f"Found: {found} item(s)")
+                if found == limit:
+                    click.echo(f"Showing the first {limit} matches. Use --limit to show more.")
 
     @content.command("show")
     @click.argument("identifier")
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option()
     @click.pass_context
     def content_show(ctx: click.Context, identifier: str, output_format: str) -> None:
         """Show detailed content information.
@@ -389,27 +467,37 @@ def create_content_group(cli: click.Group) -> click.Group:
         - Name: nginx (shows all matching items)
         - Name@version: nginx@1.20.1 (specific version)
         """
+        from sqlalchemy.orm import selectinload
+
+        from chantal.db.connection import DatabaseManager
+        from chantal.db.models import ContentItem
+
         config: GlobalConfig = ctx.obj["config"]
         db_manager = DatabaseManager(config.database.url)
 
         with db_manager.session() as session:
+            # Repositories and snapshots are listed for every item
+            items_query = session.query(ContentItem).options(
+                selectinload(ContentItem.repositories), selectinload(ContentItem.snapshots)
+            )
+
             # Try to find content by different methods
             items = []
 
-            # Check if it's a SHA256 (64 hex characters)
-            if len(identifier) == 64 and all(c in "0123456789abcdef" for c in identifier.lower()):
-                item = session.query(ContentItem).filter_by(sha256=identifier).first()
+            # Check if it's a SHA256 (64 hex characters); stored hashes are lowercase
+            if _SHA256_RE.match(identifier):
+                item = items_query.filter_by(sha256=identifier.lower()).first()
                 if item:
                     items = [item]
 
             # Check if it's name@version format
             elif "@" in identifier:
                 name, version = identifier.rsplit("@", 1)
-                items = session.query(ContentItem).filter_by(name=name, version=version).all()
+                items = items_query.filter_by(name=name, version=version).all()
 
             # Try name match (may return multiple items)
             else:
-                items = session.query(ContentItem).filter_by(name=identifier).all()
+                items = items_query.filter_by(name=identifier).all()
 
             if not items:
                 click.echo(f"Error: Content '{identifier}' not found in database.", err=True)
@@ -417,24 +505,26 @@ def create_content_group(cli: click.Group) -> click.Group:
                 ctx.exit(1)
 
             if output_format == "json":
-                result = []
-                for item in items:
-                    repo_names = [repo.repo_id for repo in item.repositories]
-                    snapshot_names = [snap.name for snap in item.snapshots]
-                    data = {
-                        "name": item.name,
-                        "version": item.version,
-                        "type": item.content_type,
-                        "filename": item.filename,
-                        "size_bytes": item.size_bytes,
-                        "sha256": item.sha256,
-                        "pool_path": item.pool_path,
-                        "repositories": repo_names,
-                        "snapshots": snapshot_names,
-                        "metadata": item.content_metadata,
-                    }
-                    result.append(data)
-                click.echo(json.dumps(result, indent=2))
+
+                def json_rows() -> Iterator[dict[str, Any]]:
+                    for item in items:
+                        repo_names = [repo.repo_id for repo in item.repositories]
+                        snapshot_names = [snap.name for snap in item.snapshots]
+                        data = {
+                            "name": item.name,
+                            "version": item.version,
+                            "type": item.content_type,
+                            "filename": item.filename,
+                            "size_bytes": item.size_bytes,
+                            "sha256": item.sha256,
+                            "pool_path": item.pool_path,
+                            "repositories": repo_names,
+                            "snapshots": snapshot_names,
+                            "metadata": item.content_metadata,
+                        }
+                        yield data
+
+                _echo_json_array(json_rows())
             else:
                 # Table format
                 if len(items) > 1:
@@ -443,13 +533,9 @@ def create_content_group(cli: click.Group) -> click.Group:
 
                 for i, item in enumerate(items, 1):
                     if len(items) > 1:
-                        click.echo(f"[{i}/{len(items)}]")
-                        click.echo("=" * 70)
+                        click.echo(f"[{i}/{len(items)}]\n{_RULE}")
                     else:
-                        click.echo("=" * 70)
-                        click.echo(f"Content: {item.name} {item.version}")
-                        click.echo("=" * 70)
-                        click.echo()
+                        click.echo(f"{_RULE}\nContent: {item.name} {item.version}\n{_RULE}\n")
 
                     click.echo("Basic Information:")
                     click.echo(f"  Name:         {item.name}")
@@ -513,7 +599,6 @@ def create_content_group(cli: click.Group) -> click.Group:
                         click.echo()
 
                 if len(items) == 1:
-                    click.echo()
-                    click.echo("=" * 70)
+                    click.echo(f"\n{_RULE}")
 
     return content
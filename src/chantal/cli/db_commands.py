@@ -2,21 +2,88 @@ from __future__ import annotations
 
 """Database management commands."""
 
+import functools
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
 import click
-from sqlalchemy.orm import Session
 
 from chantal.core.config import GlobalConfig
-from chantal.db import migrations
-from chantal.db.connection import DatabaseManager
-from chantal.db.models import Repository, Snapshot, SyncHistory
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from chantal.db.connection import DatabaseManager
+
+# SQLAlchemy, the models and Alembic are imported inside the functions that use
+# them, so `chantal --help` and commands that never touch the database don't
+# pay for them.
 
 # Click context settings to enable -h as alias for --help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+# Row layout of the `db orphaned` table (header and rows)
+_ORPHAN_ROW = "{:<30} {:<8} {:<20} {:<8} {:<10}".format
+
+
+@functools.lru_cache(maxsize=4)
+def _get_db_manager(database_url: str) -> DatabaseManager:
+    """Get the DatabaseManager for a URL, shared by all db commands in this process.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        DatabaseManager (and its engine) for the URL
+    """
+    from chantal.db.connection import DatabaseManager
+
+    return DatabaseManager(database_url)
+
 
-def _get_orphaned_repositories(session: Session, config: GlobalConfig) -> list[Repository]:
+@contextmanager
+def _db_session(ctx: click.Context, *, read_only: bool = False) -> Iterator[Session]:
+    """Open a session on the configured database and close it on exit.
+
+    Args:
+        ctx: Click context with config
+        read_only: Use an autocommit read session (for commands that don't write)
+
+    Yields:
+        Database session
+    """
+    config: GlobalConfig = ctx.obj["config"]
+    db_manager = _get_db_manager(config.database.url)
+    if read_only:
+        with db_manager.read_session() as session:
+            yield session
+        return
+    session = db_manager.get_session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@dataclass
+class _OrphanedRepository:
+    """Columns of an orphaned repository that the db commands report on."""
+
+    id: int
+    repo_id: str
+    type: str
+    last_sync_at: datetime | None
+
+
+def _get_orphaned_repositories(session: Session, config: GlobalConfig) -> list[_OrphanedRepository]:
     """Get repositories in database that are not in configuration.
 
+    Only the columns the db commands print are selected; deletion goes through
+    bulk statements, so no Repository instances are loaded.
+
     Args:
         session: Database session
         config: Global configuration
@@ -24,9 +91,107 @@ def _get_orphaned_repositories(session: Session, config: GlobalConfig) -> list[R
     Returns:
         List of orphaned repositories
     """
-    config_repo_ids = {r.id for r in config.repositories}
-    all_repos = session.query(Repository).all()
-    return [r for r in all_repos if r.repo_id not in config_repo_ids]
+    from sqlalchemy import select
+
+    from chantal.db.models import Repository
+
+    stmt = select(Repository.id, Repository.repo_id, Repository.type, Repository.last_sync_at)
+    config_repo_ids = [r.id for r in config.repositories]
+    if config_repo_ids:
+        stmt = stmt.where(Repository.repo_id.not_in(config_repo_ids))
+    return [_OrphanedRepository(*row) for row in session.execute(stmt.order_by(Repository.id))]
+
+
+def _count_by_repo(session: Session, repo_ids: list[int]) -> tuple[dict[int, int], dict[int, int]]:
+    """Count snapshots and sync history entries per repository in one query.
+
+    Both GROUP BY counts are combined with UNION ALL and tagged by table, so the
+    database is asked once instead of once per table.
+
+    Args:
+        session: Database session
+        repo_ids: Database IDs of the repositories to count for
+
+    Returns:
+        Tuple of (snapshot counts, sync history counts), each mapping repository
+        ID to row count (repositories without rows are absent)
+    """
+    from sqlalchemy import String, func, literal_column, select, union_all
+
+    from chantal.db.models import Snapshot, SyncHistory
+
+    snapshot_counts: dict[int, int] = {}
+    history_counts: dict[int, int] = {}
+    if not repo_ids:
+        return snapshot_counts, history_counts
+
+    snapshots = (
+        select(literal_column("'s'", String), Snapshot.repository_id, func.count())
+        .where(Snapshot.repository_id.in_(repo_ids))
+        .group_by(Snapshot.repository_id)
+    )
+    history = (
+        select(literal_column("'h'", String), SyncHistory.repository_id, func.count())
+        .where(SyncHistory.repository_id.in_(repo_ids))
+        .group_by(SyncHistory.repository_id)
+    )
+    counts = {"s": snapshot_counts, "h": history_counts}
+    for kind, repo_id, count in session.execute(union_all(snapshots, history)):
+        counts[kind][repo_id] = count
+    return snapshot_counts, history_counts
+
+
+def _delete_repositories(session: Session, repo_ids: list[int]) -> tuple[int, int, int]:
+    """Delete repositories with their snapshots and sync history in bulk.
+
+    Bulk ``DELETE ... WHERE ... IN`` statements bypass the ORM cascade, so the
+    many-to-many association rows of the repositories and their snapshots are
+    removed explicitly first; leaving them behind violates the foreign-key
+    constraints on PostgreSQL. The caller commits.
+
+    Args:
+        session: Database session
+        repo_ids: Database IDs of the repositories to delete
+
+    Returns:
+        Tuple of (repositories deleted, snapshots deleted, sync history entries deleted)
+    """
+    from sqlalchemy import delete, select
+
+    from chantal.db.models import (
+        Repository,
+        Snapshot,
+        SyncHistory,
+        repository_content_items,
+        repository_repository_files,
+        snapshot_content_items,
+        snapshot_repository_files,
+    )
+
+    if not repo_ids:
+        return 0, 0, 0
+    snapshot_ids = select(Snapshot.id).where(Snapshot.repository_id.in_(repo_ids))
+    for assoc in (snapshot_content_items, snapshot_repository_files):
+        session.execute(delete(assoc).where(assoc.c.snapshot_id.in_(snapshot_ids)))
+    # Sync history references snapshots, so it goes first.
+    history_deleted = (
+        session.query(SyncHistory)
+        .filter(SyncHistory.repository_id.in_(repo_ids))
+        .delete(synchronize_session=False)
+    )
+    snapshots_deleted = (
+        session.query(Snapshot)
+        .filter(Snapshot.repository_id.in_(repo_ids))
+        .delete(synchronize_session=False)
+    )
+    for assoc in (repository_content_items, repository_repository_files):
+        session.execute(delete(assoc).where(assoc.c.repository_id.in_(repo_ids)))
+    repos_deleted = (
+        session.query(Repository)
+        .filter(Repository.id.in_(repo_ids))
+        .delete(synchronize_session=False)
+    )
+    return repos_deleted, snapshots_deleted, history_deleted
 
 
 def create_db_group(cli: click.Group) -> click.Group:
@@ -52,6 +217,8 @@ def create_db_group(cli: click.Group) -> click.Group:
         Creates all database tables according to the latest schema version.
         Storage directories will be created automatically when needed.
         """
+        from chantal.db import migrations
+
         config: GlobalConfig = ctx.obj["config"]
 
         click.echo("Initializing database schema...")
@@ -80,6 +247,8 @@ def create_db_group(cli: click.Group) -> click.Group:
             chantal db upgrade head    # Upgrade to latest (explicit)
             chantal db upgrade abc123  # Upgrade to specific revision
         """
+        from chantal.db import migrations
+
         config: GlobalConfig = ctx.obj["config"]
 
         current = migrations.get_current_revision(config.database.url)
@@ -108,6 +277,8 @@ def create_db_group(cli: click.Group) -> click.Group:
     @click.pass_context
     def db_status(ctx: click.Context) -> None:
         """Show database schema status and pending migrations."""
+        from chantal.db import migrations
+
         config: GlobalConfig = ctx.obj["config"]
 
         current = migrations.get_current_revision(config.database.url)
@@ -144,8 +315,7 @@ def create_db_group(cli: click.Group) -> click.Group:
             click.echo(f"Status:    ⚠️  {len(pending)} migration(s) pending")
             click.echo()
             click.echo("Pending Migrations:")
-            for rev, msg in pending:
-                click.echo(f"  • {rev[:8]} - {msg}")
+            click.echo("\n".join(f"  • {rev[:8]} - {msg}" for rev, msg in pending))
             click.echo()
             click.echo("Run 'chantal db upgrade' to apply pending migrations.")
 
@@ -153,6 +323,8 @@ def create_db_group(cli: click.Group) -> click.Group:
     @click.pass_context
     def db_current(ctx: click.Context) -> None:
         """Show current database schema revision."""
+        from chantal.db import migrations
+
         config: GlobalConfig = ctx.obj["config"]
 
         current = migrations.get_current_revision(config.database.url)
@@ -173,6 +345,8 @@ def create_db_group(cli: click.Group) -> click.Group:
     @click.pass_context
     def db_history(ctx: click.Context) -> None:
         """Show migration history."""
+        from chantal.db import migrations
+
         config: GlobalConfig = ctx.obj["config"]
 
         history = migrations.get_migration_history(config.database.url)
@@ -185,10 +359,12 @@ def create_db_group(cli: click.Group) -> click.Group:
             click.echo("No migrations found.")
             return
 
+        lines = []
         for rev, msg, is_applied in history:
             status = "✓" if is_applied else "⧗"
             state = "Applied" if is_applied else "Pending"
-            click.echo(f"{status} {rev[:8]} - {msg} [{state}]")
+            lines.append(f"{status} {rev[:8]} - {msg} [{state}]")
+        click.echo("\n".join(lines))
 
         click.echo()
         click.echo("Legend: ✓ Applied  ⧗ Pending")
@@ -222,28 +398,35 @@ def create_db_group(cli: click.Group) -> click.Group:
         cleanup_orphaned = orphaned or (not orphaned and not unreferenced)
         cleanup_unreferenced = unreferenced or (not orphaned and not unreferenced)
 
-        # Initialize database connection
-        db_manager = DatabaseManager(config.database.url)
-        session = db_manager.get_session()
-
-        try:
+        with _db_session(ctx) as session:
             if dry_run:
                 click.echo("DRY RUN: Analyzing database issues...")
             else:
                 click.echo("Analyzing database issues...")
             click.echo()
 
-            from chantal.core.stats import format_bytes, unreferenced_content_items
+            from chantal.core.stats import (
+                format_bytes,
+                unreferenced_content_items,
+                unreferenced_totals,
+            )
 
             total_repos_deleted = 0
             total_snapshots_deleted = 0
             total_history_deleted = 0
             total_unreferenced_deleted = 0
 
-            # Get orphaned repositories (for both dry-run and confirmation)
-            orphaned_repos = []
+            # Get orphaned repositories (for both dry-run and confirmation), with
+            # their snapshot and sync history counts
+            orphaned_repos: list[_OrphanedRepository] = []
+            snapshot_counts: dict[int, int] = {}
+            history_counts: dict[int, int] = {}
             if cleanup_orphaned:
                 orphaned_repos = _get_orphaned_repositories(session, config)
+                orphan_ids = [r.id for r in orphaned_repos]
+                snapshot_counts, history_counts = _count_by_repo(session, orphan_ids)
+            total_snaps = sum(snapshot_counts.values())
+            total_hist = sum(history_counts.values())
 
             # Preview of unreferenced packages (items linked to no repository and
             # no snapshot). Deleting orphaned repos below can orphan more, so this
@@ -251,11 +434,7 @@ def create_db_group(cli: click.Group) -> click.Group:
             unref_preview_count = 0
             unref_preview_bytes = 0
             if cleanup_unreferenced:
-                unref_q = unreferenced_content_items(session)
-                unref_preview_count = unref_q.count()
-                unref_preview_bytes = (
-                    sum(i.size_bytes for i in unref_q) if unref_preview_count else 0
-                )
+                unref_preview_count, unref_preview_bytes = unreferenced_totals(session)
 
             # Interactive confirmation (only if not dry-run and not force)
             if not dry_run and not force:
@@ -265,14 +444,6 @@ def create_db_group(cli: click.Group) -> click.Group:
 
                 click.echo("Will delete:")
                 if cleanup_orphaned and orphaned_repos:
-                    total_snaps = sum(
-                        session.query(Snapshot).filter_by(repository_id=r.id).count()
-                        for r in orphaned_repos
-                    )
-                    total_hist = sum(
-                        session.query(SyncHistory).filter_by(repository_id=r.id).count()
-                        for r in orphaned_repos
-                    )
                     click.echo(f"  - {len(orphaned_repos)} orphaned repositories")
                     click.echo(f"  - {total_snaps} snapshots")
                     click.echo(f"  - {total_hist} sync history entries")
@@ -293,34 +464,22 @@ def create_db_group(cli: click.Group) -> click.Group:
 
                 if orphaned_repos:
                     click.echo(f"Orphaned repositories ({len(orphaned_repos)}):")
+                    lines = []
                     for repo in orphaned_repos:
-                        # Count related objects
-                        snapshot_count = (
-                            session.query(Snapshot).filter_by(repository_id=repo.id).count()
-                        )
-                        history_count = (
-                            session.query(SyncHistory).filter_by(repository_id=repo.id).count()
-                        )
+                        snapshot_count = snapshot_counts.get(repo.id, 0)
+                        history_count = history_counts.get(repo.id, 0)
 
-                        click.echo(
+                        lines.append(
                             f"  - {repo.repo_id} ({repo.type}, {history_count} syncs, {snapshot_count} snapshots)"
                         )
-
-                        if not dry_run:
-                            # Delete the repository via the ORM so the
-                            # cascade="all, delete-orphan" relationships remove
-                            # its snapshots and sync history AND clear their
-                            # many-to-many association rows. A bulk
-                            # query(...).delete() bypasses that cascade and leaves
-                            # dangling snapshot_content_items /
-                            # snapshot_repository_files rows, which violates the
-                            # foreign-key constraint on PostgreSQL.
-                            session.delete(repo)
-                            total_history_deleted += history_count
-                            total_snapshots_deleted += snapshot_count
-                            total_repos_deleted += 1
+                    click.echo("\n".join(lines))
 
                     if not dry_run:
+                        (
+                            total_repos_deleted,
+                            total_snapshots_deleted,
+                            total_history_deleted,
+                        ) = _delete_repositories(session, [r.id for r in orphaned_repos])
                         session.commit()
                     click.echo()
                 else:
@@ -361,14 +520,6 @@ def create_db_group(cli: click.Group) -> click.Group:
                         f"  Would delete {len(orphaned_repos) if orphaned_repos else 0} repositories"
                     )
                     if orphaned_repos:
-                        total_snaps = sum(
-                            session.query(Snapshot).filter_by(repository_id=r.id).count()
-                            for r in orphaned_repos
-                        )
-                        total_hist = sum(
-                            session.query(SyncHistory).filter_by(repository_id=r.id).count()
-                            for r in orphaned_repos
-                        )
                         click.echo(f"  Would delete {total_snaps} snapshots")
                         click.echo(f"  Would delete {total_hist} sync history entries")
                 if cleanup_unreferenced:
@@ -385,9 +536,6 @@ def create_db_group(cli: click.Group) -> click.Group:
                 if cleanup_unreferenced:
                     click.echo(f"  Deleted {total_unreferenced_deleted} unreferenced packages")
 
-        finally:
-            session.close()
-
     @db.command("orphaned")
     @click.pass_context
     def db_orphaned(ctx: click.Context) -> None:
@@ -399,32 +547,27 @@ def create_db_group(cli: click.Group) -> click.Group:
         """
         config: GlobalConfig = ctx.obj["config"]
 
-        # Initialize database connection
-        db_manager = DatabaseManager(config.database.url)
-        session = db_manager.get_session()
-
-        try:
+        with _db_session(ctx, read_only=True) as session:
             click.echo("Finding orphaned repositories...")
             click.echo()
 
             orphaned_repos = _get_orphaned_repositories(session, config)
 
             if orphaned_repos:
+                orphan_ids = [r.id for r in orphaned_repos]
+                snapshot_counts, sync_counts = _count_by_repo(session, orphan_ids)
+
                 click.echo(f"Found {len(orphaned_repos)} orphaned repositories:")
                 click.echo()
 
                 # Table header
-                click.echo(
-                    f"{'Repository ID':<30} {'Type':<8} {'Last Sync':<20} {'Syncs':<8} {'Snapshots':<10}"
-                )
+                click.echo(_ORPHAN_ROW("Repository ID", "Type", "Last Sync", "Syncs", "Snapshots"))
                 click.echo("-" * 82)
 
+                lines = []
                 for repo in orphaned_repos:
-                    # Get counts
-                    sync_count = session.query(SyncHistory).filter_by(repository_id=repo.id).count()
-                    snapshot_count = (
-                        session.query(Snapshot).filter_by(repository_id=repo.id).count()
-                    )
+                    sync_count = sync_counts.get(repo.id, 0)
+                    snapshot_count = snapshot_counts.get(repo.id, 0)
 
                     # Format last sync
                     if repo.last_sync_at:
@@ -432,9 +575,10 @@ def create_db_group(cli: click.Group) -> click.Group:
                     else:
                         last_sync = "Never synced"
 
-                    click.echo(
-                        f"{repo.repo_id:<30} {repo.type:<8} {last_sync:<20} {sync_count:<8} {snapshot_count:<10}"
+                    lines.append(
+                        _ORPHAN_ROW(repo.repo_id, repo.type, last_sync, sync_count, snapshot_count)
                     )
+                click.echo("\n".join(lines))
 
                 click.echo()
                 click.echo(f"Total: {len(orphaned_repos)} orphaned repositories")
@@ -445,9 +589,6 @@ def create_db_group(cli: click.Group) -> click.Group:
             else:
                 click.echo("No orphaned repositories found.")
 
-        finally:
-            session.close()
-
     @db.command("stats")
     @click.pass_context
     def db_stats(ctx: click.Context) -> None:
@@ -457,35 +598,31 @@ def create_db_group(cli: click.Group) -> click.Group:
         from chantal.core.stats import (
             format_bytes,
             gather_global_stats,
-            unreferenced_content_items,
+            unreferenced_totals,
         )
 
-        config: GlobalConfig = ctx.obj["config"]
-        db_manager = DatabaseManager(config.database.url)
-        session = db_manager.get_session()
-        try:
-            s = gather_global_stats(session)
-            unref = unreferenced_content_items(session)
-            unref_count = unref.count()
-            unref_bytes = sum(item.size_bytes for item in unref) if unref_count else 0
-            total = s["content_items"]
-            referenced = total - unref_count
-
-            click.echo("Database Statistics:")
-            click.echo(f"  Total Packages: {total:,}")
-            for ctype, count in sorted(s["by_type"].items()):
-                click.echo(f"    {ctype}: {count:,}")
-            ref_pct = (referenced / total * 100) if total else 0
-            click.echo(f"  Referenced Packages: {referenced:,} ({ref_pct:.0f}%)")
-            click.echo(f"  Unreferenced Packages: {unref_count:,} ({format_bytes(unref_bytes)})")
-            click.echo(f"  Total Repositories: {s['repositories']:,}")
-            click.echo(f"  Total Snapshots: {s['snapshots']:,}")
-            click.echo(f"  Pool Size on Disk: {format_bytes(s['pool_bytes'])}")
-        except OperationalError:
-            click.echo("Database not initialized. Run 'chantal db init' first.", err=True)
-            ctx.exit(1)
-        finally:
-            session.close()
+        with _db_session(ctx, read_only=True) as session:
+            try:
+                s = gather_global_stats(session)
+                unref_count, unref_bytes = unreferenced_totals(session)
+                total = s["content_items"]
+                referenced = total - unref_count
+
+                click.echo("Database Statistics:")
+                click.echo(f"  Total Packages: {total:,}")
+                for ctype, count in sorted(s["by_type"].items()):
+                    click.echo(f"    {ctype}: {count:,}")
+                ref_pct = (referenced / total * 100) if total else 0
+                click.echo(f"  Referenced Packages: {referenced:,} ({ref_pct:.0f}%)")
+                click.echo(
+                    f"  Unreferenced Packages: {unref_count:,} ({format_bytes(unref_bytes)})"
+                )
+                click.echo(f"  Total Repositories: {s['repositories']:,}")
+                click.echo(f"  Total Snapshots: {s['snapshots']:,}")
+                click.echo(f"  Pool Size on Disk: {format_bytes(s['pool_bytes'])}")
+            except OperationalError:
+                click.echo("Database not initialized. Run 'chantal db init' first.", err=True)
+                ctx.exit(1)
 
     @db.command("verify")
     @click.pass_context
@@ -497,28 +634,32 @@ def create_db_group(cli: click.Group) -> click.Group:
         - Foreign key constraints
         - Repository references
         """
-        config: GlobalConfig = ctx.obj["config"]
+        from sqlalchemy import func
 
-        # Initialize database connection
-        db_manager = DatabaseManager(config.database.url)
-        session = db_manager.get_session()
+        from chantal.db.models import Repository
 
-        try:
+        config: GlobalConfig = ctx.obj["config"]
+
+        with _db_session(ctx, read_only=True) as session:
             click.echo("Verifying database integrity...")
             click.echo("=" * 60)
             click.echo()
 
             total_issues = 0
 
+            # Both queries run up front; the report below only reads the results.
+            orphaned_repos = _get_orphaned_repositories(session, config)
+            db_repo_count = session.query(func.count(Repository.id)).scalar() or 0
+
             # Check for orphaned repositories
             click.echo("Checking for orphaned repositories...")
-            orphaned_repos = _get_orphaned_repositories(session, config)
 
             if orphaned_repos:
                 click.echo(f"  ✗ Found {len(orphaned_repos)} orphaned repositories")
                 total_issues += len(orphaned_repos)
-                for repo in orphaned_repos:
-                    click.echo(f"    - {repo.repo_id} ({repo.type})")
+                click.echo(
+                    "\n".join(f"    - {repo.repo_id} ({repo.type})" for repo in orphaned_repos)
+                )
                 click.echo()
                 click.echo("    → Run 'chantal db orphaned' for details")
                 click.echo("    → Run 'chantal db cleanup --orphaned' to remove")
@@ -529,7 +670,6 @@ def create_db_group(cli: click.Group) -> click.Group:
             # Check repository counts
             click.echo("Repository statistics:")
             config_repo_count = len(config.repositories)
-            db_repo_count = session.query(Repository).count()
             click.echo(f"  Repositories in config: {config_repo_count}")
             click.echo(f"  Repositories in database: {db_repo_count}")
             click.echo()
@@ -544,9 +684,6 @@ def create_db_group(cli: click.Group) -> click.Group:
                 click.echo()
                 click.echo("Run 'chantal db cleanup --dry-run' to see what would be cleaned")
 
-        finally:
-            session.close()
-
     return db
 
 
@@ -558,18 +695,21 @@ def check_db_schema_version(ctx: click.Context) -> None:
     Args:
         ctx: Click context with config
     """
-    config: GlobalConfig = ctx.obj["config"]
+    from chantal.db import migrations
 
-    if migrations.db_needs_upgrade(config.database.url):
-        current = migrations.get_current_revision(config.database.url)
+    config: GlobalConfig = ctx.obj["config"]
 
-        if current is None:
-            click.echo("⚠️  Database not initialized!", err=True)
-            click.echo("Run 'chantal db init' to initialize the database.", err=True)
-        else:
-            pending = migrations.get_pending_migrations(config.database.url)
-            click.echo("⚠️  Database schema is outdated!", err=True)
-            click.echo(f"   {len(pending)} migration(s) pending.", err=True)
-            click.echo("Run 'chantal db upgrade' to update the database.", err=True)
+    # One revision query on the happy path; pending migrations are only
+    # listed when the schema is behind.
+    current = migrations.get_current_revision(config.database.url)
 
+    if current is None:
+        click.echo("⚠️  Database not initialized!", err=True)
+        click.echo("Run 'chantal db init' to initialize the database.", err=True)
+        ctx.exit(1)
+    elif current != migrations.get_head_revision(config.database.url):
+        pending = migrations.get_pending_migrations(config.database.url)
+        click.echo("⚠️  Database schema is outdated!", err=True)
+        click.echo(f"   {len(pending)} migration(s) pending.", err=True)
+        click.echo("Run 'chantal db upgrade' to update the database.", err=True)
         ctx.exit(1)
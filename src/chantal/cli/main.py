@@ -6,33 +6,174 @@ Main CLI entry point for Chantal.
 This module provides the Click-based command-line interface for Chantal.
 """
 
+import importlib
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from chantal import __version__
-
-# Import command group factories
-from chantal.cli.cache_commands import create_cache_group
-from chantal.cli.content_commands import create_content_group
-from chantal.cli.db_commands import create_db_group
-from chantal.cli.package_commands import create_package_group
-from chantal.cli.pool_commands import create_pool_group
-from chantal.cli.publish_commands import create_publish_group
-from chantal.cli.repo_commands import create_repo_group
-from chantal.cli.snapshot_commands import create_snapshot_group
-from chantal.cli.view_commands import create_view_group
-from chantal.core.config import GlobalConfig, load_config
+if TYPE_CHECKING:
+    from chantal.core.config import GlobalConfig
 
 # Click context settings to enable -h as alias for --help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+# Command groups, as "module:factory". The factory is the module's
+# create_*_group(cli) function; modules are imported when their group is used.
+LAZY_COMMAND_GROUPS = {
+    "cache": "chantal.cli.cache_commands:create_cache_group",
+    "content": "chantal.cli.content_commands:create_content_group",
+    "db": "chantal.cli.db_commands:create_db_group",
+    "package": "chantal.cli.package_commands:create_package_group",
+    "pool": "chantal.cli.pool_commands:create_pool_group",
+    "publish": "chantal.cli.publish_commands:create_publish_group",
+    "repo": "chantal.cli.repo_commands:create_repo_group",
+    "snapshot": "chantal.cli.snapshot_commands:create_snapshot_group",
+    "view": "chantal.cli.view_commands:create_view_group",
+}
+
+# Short help for the top-level command listing, so "chantal --help" does not
+# have to import every group. Must match the first line of each group docstring.
+LAZY_COMMAND_HELP = {
+    "cache": "Metadata cache management commands.",
+    "content": "Content management commands (works with all content types: RPM, Helm, APT, etc.).",
+    "db": "Database management commands.",
+    "package": "Manage custom (uploaded) packages.",
+    "pool": "Storage pool management commands.",
+    "publish": "Publishing management commands.",
+    "repo": "Repository management commands.",
+    "snapshot": "Snapshot management commands.",
+    "view": "View management commands.",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand groups on first use.
+
+    Most command modules pull in SQLAlchemy, the models and the plugins. Loading
+    them only for the group being invoked keeps e.g. ``chantal cache list`` from
+    importing the sync and publish stacks.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, str] | None = None,
+        lazy_help: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to ``"module:factory"``
+            lazy_help: Short help shown for lazy commands that are not loaded yet
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_help = lazy_help or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, factory_name = self.lazy_subcommands[cmd_name].split(":")
+            factory = getattr(importlib.import_module(module_name), factory_name)
+            factory(self)  # registers the group on this CLI
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+
+        rows = []
+        for name in names:
+            cmd: click.Command | None
+            if name not in self.commands and name in self.lazy_help:
+                # Placeholder so the text is shortened exactly like a loaded group's
+                cmd = click.Command(name, help=self.lazy_help[name])
+            else:
+                cmd = self.get_command(ctx, name)
+            if cmd is None or cmd.hidden:
+                continue
+            rows.append((name, cmd.get_short_help_str(limit)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+class CliState(dict[str, Any]):
+    """``ctx.obj`` of the CLI; loads the configuration on first ``["config"]`` access.
+
+    Parsing and validating the YAML files is skipped for invocations that never
+    read it, such as ``chantal repo sync --help`` or ``chantal schema``.
+    """
+
+    def __init__(self, config_path: Path | None) -> None:
+        """Initialize the state.
+
+        Args:
+            config_path: Configuration file given with ``--config``, if any
+        """
+        super().__init__()
+        self.config_path = config_path
+
+    def __missing__(self, key: str) -> Any:
+        if key != "config":
+            raise KeyError(key)
+        self["config"] = config = self._load_config()
+        return config
+
+    def _load_config(self) -> GlobalConfig:
+        from chantal.core.config import GlobalConfig, load_config
+
+        ctx = click.get_current_context()
+        try:
+            return load_config(self.config_path)
+        except FileNotFoundError:
+            if self.config_path:
+                # User specified a config file that doesn't exist - fail
+                click.echo(f"Error: Configuration file not found: {self.config_path}", err=True)
+                ctx.exit(1)
+            # No config file found, use defaults
+            return GlobalConfig()
+        except ValueError as e:
+            # YAML syntax error or validation error
+            click.echo(f"Error: {e}", err=True)
+            ctx.exit(1)
+
+
+def _print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    """Print the version and exit; the version is only resolved when asked for."""
+    if not value or ctx.resilient_parsing:
+        return
+
+    from chantal import __version__
 
-@click.group(context_settings=CONTEXT_SETTINGS)
-@click.version_option(version=__version__)
+    click.echo(f"{ctx.find_root().info_name}, version {__version__}")
+    ctx.exit()
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_COMMAND_GROUPS,
+    lazy_help=LAZY_COMMAND_HELP,
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.option(
+    "--version",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=_print_version,
+    help="Show the version and exit.",
+)
 @click.option(
     "--config",
-    type=click.Path(exists=True, path_type=Path),
+    type=click.Path(dir_okay=False, path_type=Path),
     default=None,
     help="Path to configuration file (default: /etc/chantal/config.yaml, or $CHANTAL_CONFIG)",
 )
@@ -43,24 +184,10 @@ def cli(ctx: click.Context, config: Path | None, verbose: bool) -> None:
 
     Because every other name was already taken.
     """
-    ctx.ensure_object(dict)
-    ctx.obj["verbose"] = verbose
-
-    # Load configuration
-    try:
-        ctx.obj["config"] = load_config(config)
-    except FileNotFoundError:
-        if config:
-            # User specified a config file that doesn't exist - fail
-            click.echo(f"Error: Configuration file not found: {config}", err=True)
-            ctx.exit(1)
-        else:
-            # No config file found, use defaults
-            ctx.obj["config"] = GlobalConfig()
-    except ValueError as e:
-        # YAML syntax error or validation error
-        click.echo(f"Error: {e}", err=True)
-        ctx.exit(1)
+    state = CliState(config)
+    state.update(ctx.obj or {})
+    state["verbose"] = verbose
+    ctx.obj = state
 
     if verbose:
         click.echo(f"Loaded configuration: {len(ctx.obj['config'].repositories)} repositories")
@@ -94,32 +221,39 @@ def stats(ctx: click.Context, repo_id: str) -> None:
                 if s is None:
                     click.echo(f"Repository '{repo_id}' not found in the database.", err=True)
                     ctx.exit(1)
-                click.echo(f"Statistics for repository: {s['repo_id']} ({s['type']}, {s['mode']})")
-                click.echo(f"  Packages: {s['content_items']:,}")
-                for ctype, count in sorted(s["by_type"].items()):
-                    click.echo(f"    {ctype}: {count:,}")
-                click.echo(f"  Snapshots: {s['snapshots']:,}")
-                click.echo(f"  Size: {format_bytes(s['pool_bytes'])}")
+                lines = [
+                    f"Statistics for repository: {s['repo_id']} ({s['type']}, {s['mode']})",
+                    f"  Packages: {s['content_items']:,}",
+                ]
+                lines += [
+                    f"    {ctype}: {count:,}" for ctype, count in sorted(s["by_type"].items())
+                ]
+                lines += [
+                    f"  Snapshots: {s['snapshots']:,}",
+                    f"  Size: {format_bytes(s['pool_bytes'])}",
+                ]
             else:
                 s = gather_global_stats(session)
-                click.echo("Global Statistics:")
-                click.echo(f"  Total Repositories: {s['repositories']:,}")
-                click.echo(f"  Total Packages: {s['content_items']:,}")
-                for ctype, count in sorted(s["by_type"].items()):
-                    click.echo(f"    {ctype}: {count:,}")
-                click.echo(f"  Total Snapshots: {s['snapshots']:,}")
-                click.echo(f"  Pool Size on Disk: {format_bytes(s['pool_bytes'])}")
-                click.echo(
+                lines = [
+                    "Global Statistics:",
+                    f"  Total Repositories: {s['repositories']:,}",
+                    f"  Total Packages: {s['content_items']:,}",
+                ]
+                lines += [
+                    f"    {ctype}: {count:,}" for ctype, count in sorted(s["by_type"].items())
+                ]
+                lines += [
+                    f"  Total Snapshots: {s['snapshots']:,}",
+                    f"  Pool Size on Disk: {format_bytes(s['pool_bytes'])}",
                     f"  Deduplication: {format_bytes(s['saved_bytes'])} saved "
-                    f"({s['dedup_pct']:.0f}%)"
-                )
+                    f"({s['dedup_pct']:.0f}%)",
+                ]
     except OperationalError:
         click.echo("Database not initialized. Run 'chantal db init' first.", err=True)
         ctx.exit(1)
+    click.echo("\n".join(lines))
 
 
-# ============================================================================
-# Register Command Groups
 @cli.command("schema")
 @click.option(
     "--output",
@@ -147,20 +281,6 @@ def schema(output: Path | None) -> None:
         click.echo(text, nl=False)
 
 
-# ============================================================================
-
-# Register all command groups
-create_cache_group(cli)
-create_db_group(cli)
-create_repo_group(cli)
-create_snapshot_group(cli)
-create_view_group(cli)
-create_content_group(cli)
-create_pool_group(cli)
-create_publish_group(cli)
-create_package_group(cli)
-
-
 # ============================================================================
 # Entry Point
 # ============================================================================
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+"""Click options shared by several command modules."""
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import click
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# One Choice instance per format set, shared by every command that uses it.
+_FORMATS = click.Choice(("table", "json"))
+_FORMATS_WITH_CSV = click.Choice(("table", "json", "csv"))
+
+
+def output_format_option(*, csv: bool = False) -> Callable[[F], F]:
+    """Return the ``--format`` option, passed to the command as ``output_format``.
+
+    Args:
+        csv: Also accept ``csv`` in addition to ``table`` and ``json``
+
+    Returns:
+        Click option decorator defaulting to ``table``
+    """
+    return click.option(
+        "--format",
+        "output_format",
+        type=_FORMATS_WITH_CSV if csv else _FORMATS,
+        default="table",
+        help="Output format",
+    )
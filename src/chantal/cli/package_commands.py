@@ -9,6 +9,7 @@ pool and linked to the repository as ContentItems, so the existing publisher
 includes them when it regenerates the repository metadata.
 """
 
+import mmap
 from pathlib import Path
 from typing import Any
 
@@ -46,6 +47,19 @@ def _get_or_create_repository(session: Session, repo_config: RepositoryConfig) -
     return repository
 
 
+def _read_rpm_header(path: Path) -> dict:
+    """Parse an RPM's main header without reading the whole package.
+
+    The file is mmap'ed so only the lead/header pages near the start are
+    actually read, not the - potentially multi-GB - payload.
+    """
+    with open(path, "rb") as fh:
+        if path.stat().st_size == 0:
+            return parse_main_header(b"")  # raises RpmFormatError
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_main_header(mm)
+
+
 def _upload_rpm(
     session: Session, storage: StorageManager, repository: Repository, path: Path, force: bool
 ) -> str:
@@ -53,7 +67,7 @@ def _upload_rpm(
 
     Returns "uploaded", "linked" (already in pool) or "replaced".
     """
-    meta = parse_main_header(path.read_bytes())  # RpmFormatError if not an RPM
+    meta = _read_rpm_header(path)  # RpmFormatError if not an RPM
     name = meta.get("name")
     version = meta.get("version")
     release = meta.get("release")
@@ -13,15 +13,11 @@ from pathlib import Path
 import click
 from sqlalchemy.orm import Session
 
+from chantal.cli.options import output_format_option
 from chantal.core.config import GlobalConfig, RepositoryConfig
 from chantal.core.storage import StorageManager
 from chantal.db.connection import DatabaseManager
 from chantal.db.models import Repository, Snapshot, View, ViewSnapshot
-from chantal.plugins.apk.publisher import ApkPublisher
-from chantal.plugins.apt.publisher import AptPublisher
-from chantal.plugins.helm.publisher import HelmPublisher
-from chantal.plugins.rpm.publisher import RpmPublisher
-from chantal.plugins.view_publisher import ViewPublisher
 
 # Click context settings to enable -h as alias for --help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
@@ -227,6 +223,8 @@ def create_publish_group(cli: click.Group) -> click.Group:
         # Connect to database
         db = DatabaseManager(config.database.url)
 
+        from chantal.plugins.view_publisher import ViewPublisher
+
         try:
             with db.session() as session:
                 # Initialize publisher
@@ -260,26 +258,23 @@ def create_publish_group(cli: click.Group) -> click.Group:
             raise
 
     @publish.command("list")
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option()
     @click.pass_context
     def publish_list(ctx: click.Context, output_format: str) -> None:
         """List currently published repositories and snapshots.
 
         Shows all published snapshots with their paths and metadata.
         """
+        from sqlalchemy.orm import joinedload
+
         config: GlobalConfig = ctx.obj["config"]
         db_manager = DatabaseManager(config.database.url)
 
         with db_manager.session() as session:
-            # Get all published snapshots
+            # Get all published snapshots, with their repository in the same SELECT
             published_snapshots = (
                 session.query(Snapshot)
+                .options(joinedload(Snapshot.repository))
                 .filter_by(is_published=True)
                 .order_by(Snapshot.created_at.desc())
                 .all()
@@ -289,11 +284,12 @@ def create_publish_group(cli: click.Group) -> click.Group:
                 result: dict[str, list[dict[str, str | int | None]]] = {"snapshots": []}
 
                 for snapshot in published_snapshots:
-                    repo = session.query(Repository).filter_by(id=snapshot.repository_id).first()
                     result["snapshots"].append(
                         {
                             "name": snapshot.name,
-                            "repository": repo.repo_id if repo else "Unknown",
+                            "repository": (
+                                snapshot.repository.repo_id if snapshot.repository else "Unknown"
+                            ),
                             "path": snapshot.published_path,
                             "packages": snapshot.package_count,
                             "size_bytes": snapshot.total_size_bytes,
@@ -304,24 +300,25 @@ def create_publish_group(cli: click.Group) -> click.Group:
                 click.echo(json.dumps(result, indent=2))
             else:
                 # Table format
-                click.echo("Currently Published:")
-                click.echo()
+                lines = [
+                    "Currently Published:",
+                    "",
+                ]
 
                 if not published_snapshots:
-                    click.echo("  No published snapshots found.")
-                    click.echo()
-                    click.echo("  Publish a snapshot with:")
-                    click.echo("    chantal publish snapshot --snapshot <name>")
+                    lines.append("  No published snapshots found.")
+                    lines.append("")
+                    lines.append("  Publish a snapshot with:")
+                    lines.append("    chantal publish snapshot --snapshot <name>")
+                    click.echo("\n".join(lines))
                     return
 
-                click.echo("Snapshots:")
-                click.echo(f"{'Name':<35} {'Repository':<25} {'Path':<50}")
-                click.echo("-" * 115)
+                lines.append("Snapshots:")
+                lines.append(f"{'Name':<35} {'Repository':<25} {'Path':<50}")
+                lines.append("-" * 115)
 
                 for snapshot in published_snapshots:
-                    # Get repository info
-                    repo = session.query(Repository).filter_by(id=snapshot.repository_id).first()
-                    repo_name = repo.repo_id if repo else "Unknown"
+                    repo_name = snapshot.repository.repo_id if snapshot.repository else "Unknown"
 
                     # Shorten path if needed
                     path = snapshot.published_path
@@ -330,10 +327,11 @@ def create_publish_group(cli: click.Group) -> click.Group:
                     elif not path:
                         path = ""
 
-                    click.echo(f"{snapshot.name:<35} {repo_name:<25} {path:<50}")
+                    lines.append(f"{snapshot.name:<35} {repo_name:<25} {path:<50}")
 
-                click.echo()
-                click.echo(f"Total: {len(published_snapshots)} published snapshot(s)")
+                lines.append("")
+                lines.append(f"Total: {len(published_snapshots)} published snapshot(s)")
+                click.echo("\n".join(lines))
 
     @publish.command("unpublish")
     @click.option("--snapshot", required=True, help="Snapshot name to unpublish")
@@ -443,6 +441,8 @@ def _publish_single_repository(
 
     # Initialize publisher based on repository type
     if repo_config.type == "rpm":
+        from chantal.plugins.rpm.publisher import RpmPublisher
+
         # Fall back to the global GPG signing config if the repo has none.
         if repo_config.gpg is None and global_config.gpg is not None:
             repo_config.gpg = global_config.gpg
@@ -464,6 +464,8 @@ def _publish_single_repository(
             click.echo(f"\n✗ Publishing failed: {e}", err=True)
             raise
     elif repo_config.type == "helm":
+        from chantal.plugins.helm.publisher import HelmPublisher
+
         helm_publisher = HelmPublisher(storage=storage)
         # Publish repository
         try:
@@ -479,6 +481,8 @@ def _publish_single_repository(
             click.echo(f"\n✗ Publishing failed: {e}", err=True)
             raise
     elif repo_config.type == "apk":
+        from chantal.plugins.apk.publisher import ApkPublisher
+
         # Fall back to the global GPG/signing config if the repo has none.
         if repo_config.gpg is None and global_config.gpg is not None:
             repo_config.gpg = global_config.gpg
@@ -503,6 +507,8 @@ def _publish_single_repository(
             click.echo(f"\n✗ Publishing failed: {e}", err=True)
             raise
     elif repo_config.type == "apt":
+        from chantal.plugins.apt.publisher import AptPublisher
+
         # Fall back to the global GPG signing config if the repo has none.
         if repo_config.gpg is None and global_config.gpg is not None:
             repo_config.gpg = global_config.gpg
@@ -604,6 +610,8 @@ def _publish_repository_snapshot(
 
         # Initialize publisher based on repository type
         if repo_config.type == "rpm":
+            from chantal.plugins.rpm.publisher import RpmPublisher
+
             # Fall back to the global GPG signing config if the repo has none.
             if repo_config.gpg is None and config.gpg is not None:
                 repo_config.gpg = config.gpg
@@ -652,6 +660,8 @@ def _publish_repository_snapshot(
                 click.echo(f"\n✗ Publishing failed: {e}", err=True)
                 raise
         elif repo_config.type == "apt":
+            from chantal.plugins.apt.publisher import AptPublisher
+
             # Fall back to the global GPG signing config if the repo has none.
             if repo_config.gpg is None and config.gpg is not None:
                 repo_config.gpg = config.gpg
@@ -745,6 +755,8 @@ def _publish_view_snapshot(
         click.echo(f"Packages: {view_snapshot.package_count}")
         click.echo()
 
+        from chantal.plugins.view_publisher import ViewPublisher
+
         # Initialize view publisher
         publisher = ViewPublisher(storage)
 
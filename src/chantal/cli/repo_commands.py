@@ -3,25 +3,30 @@ from __future__ import annotations
 """Repository management commands."""
 
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 import click
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session
 
+from chantal.cli.options import output_format_option
 from chantal.core.config import GlobalConfig, RepositoryConfig
 from chantal.core.output import OutputLevel
 from chantal.core.storage import StorageManager
 from chantal.db.connection import DatabaseManager
 from chantal.db.models import Repository, Snapshot, SyncHistory
-from chantal.plugins.apk.sync import ApkSyncer
-from chantal.plugins.apt.sync import AptSyncPlugin
-from chantal.plugins.helm.sync import HelmSyncer
-from chantal.plugins.rpm.sync import CheckUpdatesResult, RpmSyncPlugin
 
 from .db_commands import check_db_schema_version
 
+if TYPE_CHECKING:
+    from chantal.plugins.rpm.sync import CheckUpdatesResult
+
 # Click context settings to enable -h as alias for --help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+# Horizontal rule framing the detail views
+_RULE = "=" * 70
+
 
 def _format_duration(started_at: datetime, completed_at: datetime | None) -> str:
     """Format duration for display.
@@ -137,18 +142,21 @@ def _show_single_repo_history(
         click.echo(json.dumps(result, indent=2))
     else:
         # Table format
-        click.echo(f"Sync History: {repo_id}")
-        click.echo(f"Showing last {limit} sync(s)")
-        click.echo()
+        lines = [
+            f"Sync History: {repo_id}",
+            f"Showing last {limit} sync(s)",
+            "",
+        ]
 
         if not history:
-            click.echo("  No sync history found.")
-            click.echo()
-            click.echo(f"  Run 'chantal repo sync --repo-id {repo_id}' to sync this repository.")
+            lines.append("  No sync history found.")
+            lines.append("")
+            lines.append(f"  Run 'chantal repo sync --repo-id {repo_id}' to sync this repository.")
+            click.echo("\n".join(lines))
             return
 
-        click.echo(f"{'Date':<20} {'Status':<10} {'Duration':>10} {'Changes':<30}")
-        click.echo("-" * 80)
+        lines.append(f"{'Date':<20} {'Status':<10} {'Duration':>10} {'Changes':<30}")
+        lines.append("-" * 80)
 
         for sync in history:
             # Format date
@@ -165,14 +173,15 @@ def _show_single_repo_history(
                 sync.packages_added, sync.packages_updated, sync.packages_removed
             )
 
-            click.echo(f"{date_str:<20} {status_str:<10} {duration_str:>10} {changes_str:<30}")
+            lines.append(f"{date_str:<20} {status_str:<10} {duration_str:>10} {changes_str:<30}")
 
             # Show error message if failed
             if sync.status == "failed" and sync.error_message:
-                click.echo(f"  Error: {sync.error_message}")
+                lines.append(f"  Error: {sync.error_message}")
 
-        click.echo()
-        click.echo(f"Total: {len(history)} sync operation(s)")
+        lines.append("")
+        lines.append(f"Total: {len(history)} sync operation(s)")
+        click.echo("\n".join(lines))
 
 
 def _show_all_repos_last_sync(session: Session, config: GlobalConfig, output_format: str) -> None:
@@ -242,12 +251,12 @@ def _show_all_repos_last_sync(session: Session, config: GlobalConfig, output_for
         click.echo(json.dumps(json_result, indent=2))
     else:
         # Table format
-        click.echo("Sync History - All Repositories (Last Sync Only)")
-        click.echo()
-        click.echo(
-            f"{'Repository':<30} {'Last Sync':<20} {'Status':<10} {'Duration':>10} {'Changes':<20}"
-        )
-        click.echo("-" * 100)
+        lines = [
+            "Sync History - All Repositories (Last Sync Only)",
+            "",
+            f"{'Repository':<30} {'Last Sync':<20} {'Status':<10} {'Duration':>10} {'Changes':<20}",
+            "-" * 100,
+        ]
 
         synced_count = 0
         failed_count = 0
@@ -266,22 +275,23 @@ def _show_all_repos_last_sync(session: Session, config: GlobalConfig, output_for
                     last_sync.packages_removed,
                 )
 
-                click.echo(
+                lines.append(
                     f"{repo_id:<30} {date_str:<20} {status_str:<10} {duration_str:>10} {changes_str:<20}"
                 )
 
                 if last_sync.status == "failed" and last_sync.error_message:
-                    click.echo(f"  Error: {last_sync.error_message}")
+                    lines.append(f"  Error: {last_sync.error_message}")
                     failed_count += 1
                 elif last_sync.status == "success":
                     synced_count += 1
             else:
-                click.echo(f"{repo_id:<30} {'Never synced':<20} {'-':<10} {'-':>10} {'-':<20}")
+                lines.append(f"{repo_id:<30} {'Never synced':<20} {'-':<10} {'-':>10} {'-':<20}")
 
-        click.echo()
-        click.echo(
+        lines.append("")
+        lines.append(
             f"Summary: {len(result)} repositories ({synced_count} synced, {failed_count} failed)"
         )
+        click.echo("\n".join(lines))
 
 
 def _show_all_repos_history(
@@ -366,13 +376,13 @@ def _show_all_repos_history(
 
         total_width = max_repo_width + date_width + status_width + duration_width + changes_width
 
-        click.echo(f"Sync History - All Repositories (Last {limit} Syncs Each)")
-        click.echo()
-        click.echo(
+        lines = [
+            f"Sync History - All Repositories (Last {limit} Syncs Each)",
+            "",
             f"{'Repository':<{max_repo_width}} {'Date':<{date_width}} "
-            f"{'Status':<{status_width}} {'Duration':>{duration_width}} {'Changes':<{changes_width}}"
-        )
-        click.echo("-" * total_width)
+            f"{'Status':<{status_width}} {'Duration':>{duration_width}} {'Changes':<{changes_width}}",
+            "-" * total_width,
+        ]
 
         total_syncs = 0
         repos_with_history = 0
@@ -381,7 +391,7 @@ def _show_all_repos_history(
             repo_id = repo.repo_id if isinstance(repo, Repository) else repo.id
 
             if not history:
-                click.echo(
+                lines.append(
                     f"{repo_id:<{max_repo_width}} {'Never synced':<{date_width}} "
                     f"{'-':<{status_width}} {'-':>{duration_width}} {'-':<{changes_width}}"
                 )
@@ -401,20 +411,21 @@ def _show_all_repos_history(
                     sync.packages_added, sync.packages_updated, sync.packages_removed
                 )
 
-                click.echo(
+                lines.append(
                     f"{repo_display:<{max_repo_width}} {date_str:<{date_width}} "
                     f"{status_str:<{status_width}} {duration_str:>{duration_width}} {changes_str:<{changes_width}}"
                 )
 
                 if sync.status == "failed" and sync.error_message:
-                    click.echo(f"{'':<{max_repo_width}}   Error: {sync.error_message}")
+                    lines.append(f"{'':<{max_repo_width}}   Error: {sync.error_message}")
 
                 total_syncs += 1
 
-        click.echo()
-        click.echo(
+        lines.append("")
+        lines.append(
             f"Total: {len(result)} repositories ({repos_with_history} with history), {total_syncs} sync operations"
         )
+        click.echo("\n".join(lines))
 
 
 def create_repo_group(cli: click.Group) -> click.Group:
@@ -433,13 +444,7 @@ def create_repo_group(cli: click.Group) -> click.Group:
         pass
 
     @repo.command("list")
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option()
     @click.option(
         "--type",
         "repo_type",
@@ -557,7 +562,10 @@ def create_repo_group(cli: click.Group) -> click.Group:
         "--type", help="Filter by repository type (rpm, apt) when using --all or --pattern"
     )
     @click.option(
-        "--workers", type=int, default=1, help="Number of parallel workers for --all or --pattern"
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel workers for --all or --pattern (PostgreSQL only)",
     )
     @click.option(
         "-v",
@@ -598,7 +606,7 @@ def create_repo_group(cli: click.Group) -> click.Group:
             click.echo("Error: Either --repo-id, --all, or --pattern is required")
             raise click.Abort()
 
-        if sum([bool(repo_id), bool(all), bool(pattern)]) > 1:
+        if bool(repo_id) + bool(all) + bool(pattern) > 1:
             click.echo("Error: Cannot use multiple selection methods (--repo-id, --all, --pattern)")
             raise click.Abort()
 
@@ -620,6 +628,15 @@ def create_repo_group(cli: click.Group) -> click.Group:
 
         config: GlobalConfig = ctx.obj["config"]
 
+        # SQLite allows a single writer at a time, so concurrent syncs would
+        # fail with "database is locked".
+        if workers > 1 and make_url(config.database.url).get_backend_name() == "sqlite":
+            click.echo(
+                "Error: --workers > 1 requires PostgreSQL; SQLite databases must be synced "
+                "with --workers 1"
+            )
+            raise click.Abort()
+
         # Initialize managers
         storage = StorageManager(config.storage)
         db_manager = DatabaseManager(config.database.url)
@@ -644,7 +661,12 @@ def create_repo_group(cli: click.Group) -> click.Group:
 
                 click.echo(f"Found {len(repos_to_sync)} repositories to sync\n")
 
-                # TODO: Implement parallel workers if workers > 1
+                if workers > 1:
+                    _sync_repositories_parallel(
+                        db_manager, storage, config, repos_to_sync, output_level, workers
+                    )
+                    return
+
                 for repo_config in repos_to_sync:
                     click.echo(f"--- Syncing {repo_config.id} ---")
                     _sync_single_repository(session, storage, config, repo_config, output_level)
@@ -675,7 +697,12 @@ def create_repo_group(cli: click.Group) -> click.Group:
 
                 click.echo(f"Found {len(repos_to_sync)} repositories to sync\n")
 
-                # TODO: Implement parallel workers if workers > 1
+                if workers > 1:
+                    _sync_repositories_parallel(
+                        db_manager, storage, config, repos_to_sync, output_level, workers
+                    )
+                    return
+
                 for repo_config in repos_to_sync:
                     click.echo(f"--- Syncing {repo_config.id} ---")
                     _sync_single_repository(session, storage, config, repo_config, output_level)
@@ -693,13 +720,7 @@ def create_repo_group(cli: click.Group) -> click.Group:
 
     @repo.command("show")
     @click.option("--repo-id", required=True, help="Repository ID")
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option()
     @click.pass_context
     def repo_show(ctx: click.Context, repo_id: str, output_format: str) -> None:
         """Show detailed repository information.
@@ -771,10 +792,7 @@ def create_repo_group(cli: click.Group) -> click.Group:
                 click.echo(json.dumps(result, indent=2))
             else:
                 # Table format
-                click.echo("=" * 70)
-                click.echo(f"Repository: {repository.repo_id}")
-                click.echo("=" * 70)
-                click.echo()
+                click.echo(f"{_RULE}\nRepository: {repository.repo_id}\n{_RULE}\n")
 
                 click.echo("Configuration:")
                 click.echo(f"  Name:         {repository.name}")
@@ -831,8 +849,7 @@ def create_repo_group(cli: click.Group) -> click.Group:
                             f"  - {snap.name:<30} {snap.created_at.strftime('%Y-%m-%d %H:%M')}{published}"
                         )
 
-                click.echo()
-                click.echo("=" * 70)
+                click.echo(f"\n{_RULE}")
 
     @repo.command("check-updates")
     @click.option("--repo-id", help="Repository ID to check")
@@ -843,13 +860,7 @@ def create_repo_group(cli: click.Group) -> click.Group:
     @click.option(
         "--type", help="Filter by repository type (rpm, apt) when using --all or --pattern"
     )
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option()
     @click.pass_context
     def repo_check_updates(
         ctx: click.Context,
@@ -881,7 +892,7 @@ def create_repo_group(cli: click.Group) -> click.Group:
             click.echo("Error: Either --repo-id, --all, or --pattern is required")
             raise click.Abort()
 
-        if sum([bool(repo_id), bool(all), bool(pattern)]) > 1:
+        if bool(repo_id) + bool(all) + bool(pattern) > 1:
             click.echo("Error: Cannot use multiple selection methods (--repo-id, --all, --pattern)")
             raise click.Abort()
 
@@ -965,13 +976,7 @@ def create_repo_group(cli: click.Group) -> click.Group:
     @click.option("--all", is_flag=True, help="Show sync history for all repositories")
     @click.option("--last", is_flag=True, help="Show only last sync (use with --all)")
     @click.option("--limit", type=int, default=10, help="Number of sync entries to show")
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option()
     @click.pass_context
     def repo_history(
         ctx: click.Context,
@@ -1092,6 +1097,8 @@ def _sync_single_repository(
 
     # Initialize sync plugin based on repository type
     if repo_config.type == "rpm":
+        from chantal.plugins.rpm.sync import RpmSyncPlugin
+
         # Create sync history entry
         sync_history = SyncHistory(
             repository_id=repository.id,
@@ -1147,6 +1154,8 @@ def _sync_single_repository(
 
         return repository
     elif repo_config.type == "helm":
+        from chantal.plugins.helm.sync import HelmSyncer
+
         # Create sync history entry
         sync_history = SyncHistory(
             repository_id=repository.id,
@@ -1194,6 +1203,8 @@ def _sync_single_repository(
 
         return repository
     elif repo_config.type == "apk":
+        from chantal.plugins.apk.sync import ApkSyncer
+
         # Create sync history entry
         sync_history = SyncHistory(
             repository_id=repository.id,
@@ -1245,6 +1256,8 @@ def _sync_single_repository(
 
         return repository
     elif repo_config.type == "apt":
+        from chantal.plugins.apt.sync import AptSyncPlugin
+
         # Create sync history entry
         sync_history = SyncHistory(
             repository_id=repository.id,
@@ -1304,6 +1317,63 @@ def _sync_single_repository(
         raise click.Abort()
 
 
+def _sync_repositories_parallel(
+    db_manager: DatabaseManager,
+    storage: StorageManager,
+    global_config: GlobalConfig,
+    repos: list[RepositoryConfig],
+    output_level: OutputLevel,
+    workers: int,
+) -> None:
+    """Sync several repositories concurrently.
+
+    Each worker thread uses its own database session. A sync is dominated by
+    downloads and file hashing/copying, which release the GIL, so threads
+    overlap well. A failing repository does not stop the others. Content shared
+    between repositories is inserted once (see
+    :func:`chantal.db.content.add_content_item`); the caller ensures the
+    database is not SQLite, which allows only one writer at a time.
+
+    Args:
+        db_manager: Database manager to open the per-worker sessions from
+        storage: Storage manager
+        global_config: Global configuration
+        repos: Repositories to sync
+        output_level: Output verbosity level
+        workers: Maximum number of repositories synced at the same time
+
+    Raises:
+        click.Abort: If one or more repositories failed to sync
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    def sync_one(repo_config: RepositoryConfig) -> None:
+        click.echo(f"--- Syncing {repo_config.id} ---")
+        with db_manager.session() as session:
+            _sync_single_repository(session, storage, global_config, repo_config, output_level)
+
+    failed: list[str] = []
+    with ThreadPoolExecutor(max_workers=min(workers, len(repos))) as pool:
+        futures = {pool.submit(sync_one, repo_config): repo_config.id for repo_config in repos}
+        for future in as_completed(futures):
+            repo_id = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed.append(repo_id)
+                click.echo(f"✗ {repo_id}: sync failed: {e}", err=True)
+            else:
+                click.echo(f"--- Finished {repo_id} ---")
+
+    if failed:
+        click.echo(
+            f"Error: {len(failed)} of {len(repos)} repositories failed to sync: "
+            + ", ".join(sorted(failed)),
+            err=True,
+        )
+        raise click.Abort()
+
+
 def _check_updates_single_repository(
     session: Session,
     storage: StorageManager,
@@ -1311,6 +1381,8 @@ def _check_updates_single_repository(
     repo_config: RepositoryConfig,
 ) -> CheckUpdatesResult:
     """Helper function to check updates for a single repository."""
+    from chantal.plugins.rpm.sync import CheckUpdatesResult
+
     # Get or create repository in database
     repository = session.query(Repository).filter_by(repo_id=repo_config.id).first()
     if not repository:
@@ -1349,6 +1421,8 @@ def _check_updates_single_repository(
 
     # Initialize sync plugin based on repository type
     if repo_config.type == "rpm":
+        from chantal.plugins.rpm.sync import RpmSyncPlugin
+
         sync_plugin = RpmSyncPlugin(
             storage=storage,
             config=repo_config,
@@ -8,7 +8,10 @@ from pathlib import Path
 from typing import Any
 
 import click
+from sqlalchemy import type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 
+from chantal.cli.options import output_format_option
 from chantal.core.config import GlobalConfig
 from chantal.db.connection import DatabaseManager
 from chantal.db.models import ContentItem, Repository, Snapshot, View, ViewSnapshot
@@ -63,12 +66,14 @@ def _referencing_view_snapshots(session: Any, snapshot_id: int) -> list[ViewSnap
     ``ViewSnapshot.snapshot_ids`` is a plain JSON list of ``Snapshot.id`` with no
     foreign key or cascade, so deleting a referenced snapshot would silently leave
     a dangling reference that breaks the view snapshot when it is later published.
-    JSON-array containment is not portable across backends, so candidates are
-    filtered in Python.
+    JSON-array containment is not portable across backends: on PostgreSQL the
+    JSONB ``@>`` operator narrows candidates via the GIN index, elsewhere they
+    are filtered in Python.
     """
-    return [
-        vs for vs in session.query(ViewSnapshot).all() if snapshot_id in (vs.snapshot_ids or [])
-    ]
+    query = session.query(ViewSnapshot)
+    if session.get_bind().dialect.name == "postgresql":
+        query = query.filter(type_coerce(ViewSnapshot.snapshot_ids, JSONB).contains([snapshot_id]))
+    return [vs for vs in query.all() if snapshot_id in (vs.snapshot_ids or [])]
 
 
 def create_snapshot_group(cli: click.Group) -> click.Group:
@@ -95,14 +100,16 @@ def create_snapshot_group(cli: click.Group) -> click.Group:
         Shows all snapshots with package count, size, and creation date.
         Optionally filter by repository ID.
         """
+        from sqlalchemy.orm import joinedload
+
         config: GlobalConfig = ctx.obj["config"]
 
         # Initialize database
         db_manager = DatabaseManager(config.database.url)
 
         with db_manager.session() as session:
-            # Build query
-            query = session.query(Snapshot)
+            # Build query; load each snapshot's repository in the same SELECT
+            query = session.query(Snapshot).options(joinedload(Snapshot.repository))
 
             if repo_id:
                 # Filter by repository
@@ -132,9 +139,7 @@ def create_snapshot_group(cli: click.Group) -> click.Group:
             click.echo("-" * 100)
 
             for snapshot in snapshots:
-                # Get repository info
-                repo = session.query(Repository).filter_by(id=snapshot.repository_id).first()
-                repo_name = repo.repo_id if repo else "Unknown"
+                repo_name = snapshot.repository.repo_id if snapshot.repository else "Unknown"
 
                 # Format size
                 size_gb = snapshot.total_size_bytes / (1024**3)
@@ -200,13 +205,7 @@ def create_snapshot_group(cli: click.Group) -> click.Group:
     @click.option("--repo-id", required=True, help="Repository ID")
     @click.argument("snapshot1")
     @click.argument("snapshot2")
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option()
     @click.pass_context
     def snapshot_diff(
         ctx: click.Context, repo_id: str, snapshot1: str, snapshot2: str, output_format: str
@@ -524,13 +523,7 @@ def create_snapshot_group(cli: click.Group) -> click.Group:
     @click.option("--repo-id", help="Repository ID (for repository snapshots)")
     @click.option("--view", help="View name (for view snapshots)")
     @click.option("--snapshot", "snapshot_name", required=True, help="Snapshot name")
-    @click.option(
-        "--format",
-        "output_format",
-        type=click.Choice(["table", "json", "csv"]),
-        default="table",
-        help="Output format",
-    )
+    @output_format_option(csv=True)
     @click.option("--limit", type=int, help="Limit number of packages shown (table format only)")
     @click.pass_context
     def snapshot_content(
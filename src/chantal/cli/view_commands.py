@@ -6,6 +6,7 @@ import json
 
 import click
 
+from chantal.cli.options import output_format_option
 from chantal.core.config import GlobalConfig
 
 # Click context settings to enable -h as alias for --help
@@ -32,9 +33,7 @@ def create_view_group(cli: click.Group) -> click.Group:
         pass
 
     @view.command("list")
-    @click.option(
-        "--format", "output_format", type=click.Choice(["table", "json"]), default="table"
-    )
+    @output_format_option()
     @click.pass_context
     def view_list(ctx: click.Context, output_format: str) -> None:
         """List all configured views."""
@@ -82,9 +81,7 @@ def create_view_group(cli: click.Group) -> click.Group:
 
     @view.command("show")
     @click.option("--name", required=True, help="View name")
-    @click.option(
-        "--format", "output_format", type=click.Choice(["table", "json"]), default="table"
-    )
+    @output_format_option()
     @click.pass_context
     def view_show(ctx: click.Context, name: str, output_format: str) -> None:
         """Show detailed information about a view."""
@@ -7,6 +7,8 @@ This package provides core services like configuration management,
 storage, and plugin system.
 """
 
+from typing import TYPE_CHECKING
+
 from chantal.core.config import (
     AuthConfig,
     ConfigLoader,
@@ -20,7 +22,9 @@ from chantal.core.config import (
     create_example_config,
     load_config,
 )
-from chantal.core.storage import StorageManager
+
+if TYPE_CHECKING:
+    from chantal.core.storage import StorageManager
 
 __all__ = [
     "AuthConfig",
@@ -36,3 +40,17 @@ __all__ = [
     "create_example_config",
     "load_config",
 ]
+
+
+def __getattr__(name: str) -> type[StorageManager]:
+    """Import ``StorageManager`` on first access (PEP 562).
+
+    The storage module pulls in SQLAlchemy and the database models; importing it
+    eagerly here would load them for every module under ``chantal.core``.
+    """
+    if name != "StorageManager":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from chantal.core.storage import StorageManager
+
+    return StorageManager
@@ -9,6 +9,7 @@ to avoid repeated downloads of large metadata files.
 
 import hashlib
 import logging
+import os
 import re
 import time
 from dataclasses import dataclass
@@ -248,7 +249,7 @@ class MetadataCache:
         finally:
             temp_file.unlink(missing_ok=True)
 
-    def clear(self, pattern: str | None = None) -> int:
+    def clear(self, pattern: str | None = None) -> tuple[int, int]:
         """Clear cache entries.
 
         Args:
@@ -256,29 +257,33 @@ class MetadataCache:
                     If None, clears all cache entries
 
         Returns:
-            Number of files deleted
+            Tuple of (files_deleted, bytes_freed)
         """
         if not self.enabled or not self.cache_path:
-            return 0
+            return 0, 0
 
         files_deleted = 0
+        bytes_freed = 0
 
         if pattern:
             # Delete matching files
             for cache_file in self.cache_path.glob(pattern):
                 if cache_file.is_file():
+                    bytes_freed += cache_file.stat().st_size
                     cache_file.unlink()
                     files_deleted += 1
                     logger.debug(f"Deleted cache file: {cache_file.name}")
         else:
-            # Delete all cache files
-            for cache_file in self.cache_path.glob("*.xml.gz"):
-                if cache_file.is_file():
-                    cache_file.unlink()
-                    files_deleted += 1
+            # Delete all cache files, sizing them from the same directory pass
+            with os.scandir(self.cache_path) as it:
+                for entry in it:
+                    if entry.name.endswith(".xml.gz") and entry.is_file():
+                        bytes_freed += entry.stat().st_size
+                        os.unlink(entry.path)
+                        files_deleted += 1
 
         logger.info(f"Cleared {files_deleted} cache file(s)")
-        return files_deleted
+        return files_deleted, bytes_freed
 
     def stats(self) -> CacheStats:
         """Get cache statistics.
@@ -299,13 +304,16 @@ class MetadataCache:
         oldest_mtime: float | None = None
         newest_mtime: float | None = None
 
-        for cache_file in self.cache_path.glob("*.xml.gz"):
-            if not cache_file.is_file():
-                continue
+        # One directory pass; each entry is stat'ed once (is_file() usually
+        # comes from the directory listing itself)
+        with os.scandir(self.cache_path) as it:
+            entries = [e for e in it if e.name.endswith(".xml.gz") and e.is_file()]
 
+        for entry in entries:
+            st = entry.stat()
             total_files += 1
-            total_size_bytes += cache_file.stat().st_size
-            mtime = cache_file.stat().st_mtime
+            total_size_bytes += st.st_size
+            mtime = st.st_mtime
 
             if oldest_mtime is None or mtime < oldest_mtime:
                 oldest_mtime = mtime
@@ -7,12 +7,19 @@ This module provides Pydantic models for configuration validation and
 YAML-based configuration loading with include support.
 """
 
+import re
 from pathlib import Path, PurePosixPath
 from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+try:
+    # libyaml's C parser is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class ProxyConfig(BaseModel):
     """HTTP proxy configuration."""
@@ -436,8 +443,6 @@ class PatternFilterConfig(BaseModel):
     def validate_patterns(cls, v: list[str] | None) -> list[str] | None:
         """Validate regex patterns."""
         if v is not None:
-            import re
-
             for pattern in v:
                 try:
                     re.compile(pattern)
@@ -489,8 +494,6 @@ class FilterConfig(BaseModel):
     def validate_patterns_legacy(cls, v: list[str] | None) -> list[str] | None:
         """Validate regex patterns (legacy)."""
         if v is not None:
-            import re
-
             for pattern in v:
                 try:
                     re.compile(pattern)
@@ -837,6 +840,26 @@ class GlobalConfig(BaseModel):
         return [view for view in self.views if repo_id in view.repos]
 
 
+def _load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file with the fastest available safe loader.
+
+    libyaml reports syntax errors without the offending source line, so a file
+    that fails to parse is read again with the pure-Python loader, which raises
+    the more helpful error.
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    with open(path) as f:
+        try:
+            return yaml.load(f, Loader=_SafeLoader)
+        except yaml.YAMLError:
+            if _SafeLoader is yaml.SafeLoader:
+                raise
+            f.seek(0)
+            return yaml.safe_load(f)
+
+
 class ConfigLoader:
     """Configuration file loader with include support."""
 
@@ -863,8 +886,7 @@ class ConfigLoader:
 
         # Load main config file
         try:
-            with open(self.config_path) as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = _load_yaml_file(self.config_path) or {}
         except yaml.YAMLError as e:
             raise ValueError(f"YAML syntax error in {self.config_path}:\n{e}") from e
 
@@ -930,12 +952,11 @@ class ConfigLoader:
         for config_file in config_files:
             if config_file.suffix in [".yaml", ".yml"]:
                 try:
-                    with open(config_file) as f:
-                        data = yaml.safe_load(f) or {}
-                        if "repositories" in data:
-                            all_repos.extend(data["repositories"])
-                        if "views" in data:
-                            all_views.extend(data["views"])
+                    data = _load_yaml_file(config_file) or {}
+                    if "repositories" in data:
+                        all_repos.extend(data["repositories"])
+                    if "views" in data:
+                        all_views.extend(data["views"])
                 except yaml.YAMLError as e:
                     raise ValueError(f"YAML syntax error in {config_file}:\n{e}") from e
 
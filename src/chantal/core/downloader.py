@@ -9,13 +9,22 @@ retries, and checksums across all plugin types.
 """
 
 import hashlib
+import os
+import ssl
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote, urlparse, urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 
 from chantal.core.config import (
     AuthConfig,
@@ -46,6 +55,90 @@ def _proxy_url_with_auth(url: str, username: str | None, password: str | None) -
     return urlunsplit((parts.scheme, netloc, parts.path, parts.query, parts.fragment))
 
 
+def _connect_retries_exhausted(exc: Exception) -> bool:
+    """Tell whether ``exc`` is a connect failure the adapter already retried.
+
+    The session adapter retries failed connection attempts itself and raises
+    ``MaxRetryError`` (wrapped in ``requests.ConnectionError``) once those are
+    used up. ``NewConnectionError`` (refused, unresolvable) subclasses
+    ``ConnectTimeoutError``, so both are covered. Connections dropped while
+    reading also surface as ``requests.ConnectionError`` but are not wrapped in
+    ``MaxRetryError``, as the adapter does not retry reads.
+    """
+    if not isinstance(exc, requests.ConnectionError) or not exc.args:
+        return False
+    reason = exc.args[0]
+    return isinstance(reason, MaxRetryError) and isinstance(reason.reason, ConnectTimeoutError)
+
+
+class _TLSContextAdapter(HTTPAdapter):
+    """HTTPAdapter that builds each TLS context once and reuses it.
+
+    Left to itself, urllib3 creates a fresh ``SSLContext`` for every new
+    connection and re-parses the CA bundle and the client certificate/key PEM
+    files into it. This adapter builds one context per (CA bundle, client
+    cert) combination and hands it to the connection pools instead, so the
+    PEM parsing happens once per session rather than once per connection.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._ssl_contexts: dict[tuple[Any, Any], ssl.SSLContext | None] = {}
+        self._ssl_lock = threading.Lock()
+
+    def _ssl_context(self, verify: bool | str, cert: Any) -> ssl.SSLContext | None:
+        """Return the cached context for ``(verify, cert)``, building it once.
+
+        Returns ``None`` if the context cannot be built (unreadable CA bundle
+        or client cert); the request then takes the regular urllib3 path,
+        which reports the problem as a ``requests.exceptions.SSLError``.
+        """
+        key = (verify, cert)
+        with self._ssl_lock:
+            if key not in self._ssl_contexts:
+                ca_location = DEFAULT_CA_BUNDLE_PATH if verify is True else str(verify)
+                try:
+                    context = create_urllib3_context()
+                    if os.path.isdir(ca_location):
+                        context.load_verify_locations(capath=ca_location)
+                    else:
+                        context.load_verify_locations(cafile=ca_location)
+                    if cert:
+                        cert_file, key_file = (cert, None) if isinstance(cert, str) else cert
+                        context.load_cert_chain(cert_file, key_file)
+                except (OSError, ssl.SSLError):
+                    context = None
+                self._ssl_contexts[key] = context
+            return self._ssl_contexts[key]
+
+    def build_connection_pool_key_attributes(
+        self, request: requests.PreparedRequest, verify: bool | str, cert: Any = None
+    ) -> Any:
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        if host_params["scheme"] != "https" or not verify:
+            return host_params, pool_kwargs
+        context = self._ssl_context(verify, cert)
+        if context is None:
+            return host_params, pool_kwargs
+
+        # The context already carries the trust store and client cert.
+        kwargs: dict[str, Any] = dict(pool_kwargs)
+        for name in ("ca_certs", "ca_cert_dir", "cert_file", "key_file"):
+            kwargs.pop(name, None)
+        kwargs["ssl_context"] = context
+        return host_params, kwargs
+
+    def cert_verify(self, conn: Any, url: str, verify: bool | str, cert: Any) -> None:
+        # Keep requests' path validation, but don't let it re-attach the PEM
+        # paths to a pool that uses a preloaded context (urllib3 would load
+        # them into that context again on every new connection).
+        super().cert_verify(conn, url, verify, cert)
+        if getattr(conn, "conn_kw", {}).get("ssl_context") is not None:
+            conn.ca_certs = conn.ca_cert_dir = conn.cert_file = conn.key_file = None
+
+
 @dataclass
 class DownloadTask:
     """Single file download task."""
@@ -126,6 +219,21 @@ class RequestsBackend(DownloadBackend):
         """
         session = requests.Session()
 
+        # Size the connection pool for parallel downloads so concurrent
+        # workers reuse established (TLS) connections instead of discarding
+        # them when the default pool of 10 overflows. Failures to connect are
+        # retried with backoff at the connection level, which also covers the
+        # plain session.get() metadata fetches in the plugins; read errors are
+        # still raised immediately (download_file() retries those itself, but
+        # not connect failures, so attempts don't multiply).
+        pool_size = max(self.download_config.parallel, 10)
+        retries = Retry(total=self.download_config.retry_attempts, read=False, backoff_factor=0.5)
+        adapter = _TLSContextAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
         # Setup proxy. Proxy credentials go into the proxy URL (sent to the
         # proxy as Proxy-Authorization), never on session.auth (which would be
         # sent to the destination host, leaking the proxy credentials upstream).
@@ -191,19 +299,14 @@ class RequestsBackend(DownloadBackend):
                 print("Using client certificate authentication")
             elif auth.cert_dir:
                 # Find cert/key in directory (RHEL entitlement pattern)
-                cert_dir = Path(auth.cert_dir)
-                if cert_dir.exists():
-                    # Find first .pem certificate (not -key.pem)
-                    certs = [f for f in cert_dir.glob("*.pem") if not f.name.endswith("-key.pem")]
-                    if certs:
-                        cert_file = certs[0]
-                        # Look for corresponding key file
-                        key_file = cert_dir / cert_file.name.replace(".pem", "-key.pem")
-                        if key_file.exists():
-                            session.cert = (str(cert_file), str(key_file))
-                            print(f"Using client certificate: {cert_file.name}")
-                        else:
-                            print(f"Warning: Key file not found for {cert_file.name}")
+                pair = self._find_entitlement_cert(Path(auth.cert_dir))
+                if pair:
+                    cert_file, key_file = pair
+                    if key_file:
+                        session.cert = (str(cert_file), str(key_file))
+                        print(f"Using client certificate: {cert_file.name}")
+                    else:
+                        print(f"Warning: Key file not found for {cert_file.name}")
 
         elif auth.type == "basic":
             # HTTP Basic authentication
@@ -228,6 +331,35 @@ class RequestsBackend(DownloadBackend):
                 # differs from the original.
                 self._strip_custom_headers_on_redirect(session, set(auth.headers))
 
+    @staticmethod
+    def _find_entitlement_cert(cert_dir: Path) -> tuple[Path, Path | None] | None:
+        """Find an entitlement certificate and its key in ``cert_dir``.
+
+        RHEL entitlements are stored as ``<serial>.pem`` / ``<serial>-key.pem``
+        pairs. The directory is read once with ``os.scandir`` and pairs are
+        matched by name, without a separate ``stat`` per candidate key.
+
+        Args:
+            cert_dir: Entitlement directory (e.g. ``/etc/pki/entitlement``)
+
+        Returns:
+            ``(cert, key)`` for the first certificate that has a key,
+            ``(cert, None)`` if no certificate has one, or ``None`` if the
+            directory is missing or holds no certificates.
+        """
+        try:
+            with os.scandir(cert_dir) as it:
+                pems = {e.name: e.path for e in it if e.name.endswith(".pem") and e.is_file()}
+        except OSError:
+            return None
+
+        certs = sorted(name for name in pems if not name.endswith("-key.pem"))
+        for name in certs:
+            key_name = name[: -len(".pem")] + "-key.pem"
+            if key_name in pems:
+                return Path(pems[name]), Path(pems[key_name])
+        return (Path(pems[certs[0]]), None) if certs else None
+
     @staticmethod
     def _strip_custom_headers_on_redirect(
         session: requests.Session, custom_header_names: set[str]
@@ -302,7 +434,10 @@ class RequestsBackend(DownloadBackend):
 
             except (requests.RequestException, ValueError) as e:
                 last_exception = e
-                if attempt < self.download_config.retry_attempts:
+                if (
+                    attempt < self.download_config.retry_attempts
+                    and not _connect_retries_exhausted(e)
+                ):
                     print(
                         f"Download failed (attempt {attempt + 1}/"
                         f"{self.download_config.retry_attempts + 1}): {e}"
@@ -318,23 +453,29 @@ class RequestsBackend(DownloadBackend):
         raise RuntimeError(f"Download failed for {url}")
 
     def download_batch(self, tasks: list[DownloadTask]) -> list[Path]:
-        """Download multiple files sequentially.
+        """Download multiple files, up to ``download_config.parallel`` at a time.
+
+        All workers share the pooled session, so connections (and their TLS
+        handshakes) are reused across files.
 
         Args:
             tasks: List of download tasks
 
         Returns:
-            List of paths to downloaded files
+            List of paths to downloaded files, in task order
 
         Raises:
             requests.RequestException: On download errors
             ValueError: On checksum mismatch
         """
-        results = []
-        for task in tasks:
-            result = self.download_file(task.url, task.dest, task.expected_sha256)
-            results.append(result)
-        return results
+        workers = min(self.download_config.parallel, len(tasks))
+        if workers <= 1:
+            return [self.download_file(t.url, t.dest, t.expected_sha256) for t in tasks]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda t: self.download_file(t.url, t.dest, t.expected_sha256), tasks)
+            )
 
     def __del__(self) -> None:
         """Cleanup temporary files."""
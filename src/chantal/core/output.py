@@ -56,16 +56,18 @@ class SyncOutputter:
             return
 
         type_name = repo_type.upper()
-        self.console.print(f"Syncing {type_name} repository: {repo_id}", style="bold")
-        self.console.print(f"Feed URL: {feed_url}")
+        # Buffer the block so it reaches the terminal in a single write
+        with self.console:
+            self.console.print(f"Syncing {type_name} repository: {repo_id}", style="bold")
+            self.console.print(f"Feed URL: {feed_url}")
 
-        # Print additional kwargs
-        for key, value in kwargs.items():
-            # Convert key from snake_case to Title Case
-            display_key = key.replace("_", " ").title()
-            self.console.print(f"{display_key}: {value}")
+            # Print additional kwargs
+            for key, value in kwargs.items():
+                # Convert key from snake_case to Title Case
+                display_key = key.replace("_", " ").title()
+                self.console.print(f"{display_key}: {value}")
 
-        self.console.print()
+            self.console.print()
 
     def phase(self, name: str, number: int | None = None) -> None:
         """Show phase marker.
@@ -252,8 +254,9 @@ class SyncOutputter:
         if self.level == OutputLevel.QUIET:
             return
 
-        self.console.print("\n=== Summary ===", style="bold")
-        for key, value in stats.items():
-            # Convert key from snake_case to Title Case
-            display_key = key.replace("_", " ").title()
-            self.console.print(f"  {display_key}: {value}")
+        with self.console:
+            self.console.print("\n=== Summary ===", style="bold")
+            for key, value in stats.items():
+                # Convert key from snake_case to Title Case
+                display_key = key.replace("_", " ").title()
+                self.console.print(f"  {display_key}: {value}")
@@ -35,6 +35,22 @@ def unreferenced_content_items(session: Session) -> Query[ContentItem]:
     )
 
 
+def unreferenced_totals(session: Session) -> tuple[int, int]:
+    """Count and total size of unreferenced ContentItems in one aggregate query.
+
+    Returns:
+        Tuple of (item count, total size in bytes)
+    """
+    count, size = (
+        unreferenced_content_items(session)
+        .with_entities(
+            func.count(ContentItem.id), func.coalesce(func.sum(ContentItem.size_bytes), 0)
+        )
+        .one()
+    )
+    return int(count), int(size)
+
+
 def _sum(session: Session, column: Any) -> int:
     return int(session.query(func.coalesce(func.sum(column), 0)).scalar() or 0)
 
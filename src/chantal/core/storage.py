@@ -58,14 +58,10 @@ class StorageManager:
         Returns:
             Hex-encoded SHA256 hash
         """
-        sha256_hash = hashlib.sha256()
-
         with open(file_path, "rb") as f:
-            # Read in 64kb chunks for memory efficiency
-            for chunk in iter(lambda: f.read(65536), b""):
-                sha256_hash.update(chunk)
-
-        return sha256_hash.hexdigest()
+            # file_digest() hashes in C with a reusable buffer, avoiding a
+            # Python-level read/update round-trip per chunk.
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     def get_pool_path(self, sha256: str, filename: str, pool_type: str = "content") -> str:
         """Get relative pool path for a file.
@@ -8,6 +8,7 @@ This module provides utilities for creating and managing database connections.
 
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import cached_property
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
@@ -27,8 +28,21 @@ class DatabaseManager:
             echo: Whether to echo SQL statements (useful for debugging)
         """
         self.database_url = database_url
-        self.engine: Engine = create_engine(database_url, echo=echo)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.echo = echo
+
+    @cached_property
+    def engine(self) -> Engine:
+        """SQLAlchemy engine, created on first use.
+
+        Creating the engine imports the database driver, so it is deferred until
+        something actually talks to the database.
+        """
+        return create_engine(self.database_url, echo=self.echo)
+
+    @cached_property
+    def SessionLocal(self) -> sessionmaker[Session]:
+        """Session factory bound to :attr:`engine`."""
+        return sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
     def create_all(self) -> None:
         """Create all database tables.
@@ -67,6 +81,28 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @contextmanager
+    def read_session(self) -> Generator[Session, None, None]:
+        """Provide a session for read-only commands.
+
+        The session runs on an autocommit connection, so queries are not wrapped
+        in a BEGIN/ROLLBACK pair and no transaction is held open between them.
+        Do not use it for writes.
+
+        Usage:
+            with db_manager.read_session() as session:
+                count = session.query(Repository).count()
+        """
+        session = Session(
+            bind=self.engine.execution_options(isolation_level="AUTOCOMMIT"),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        try:
+            yield session
+        finally:
+            session.close()
+
     def get_session(self) -> Session:
         """Get a new database session.
 
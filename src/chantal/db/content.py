@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+"""
+Content item insertion shared by the sync plugins.
+"""
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from chantal.db.models import ContentItem, Repository
+
+
+def add_content_item(session: Session, item: ContentItem, repository: Repository) -> ContentItem:
+    """Add a new content item and link it to a repository.
+
+    The sync plugins look up an existing row by sha256 before inserting, but
+    with several repositories syncing at once (``repo sync --workers``) another
+    session can insert the same content between that lookup and this insert.
+    The insert therefore runs in a savepoint: if it hits the unique sha256
+    constraint, the savepoint is rolled back and the row the other session
+    inserted is linked instead.
+
+    SQLite is not synced concurrently, and pysqlite does not nest a SAVEPOINT
+    issued at the start of a transaction (releasing it would commit), so there
+    the item is added directly.
+
+    Args:
+        session: Database session
+        item: New content item, not yet added to the session
+        repository: Repository to link the content item to
+
+    Returns:
+        The content item stored for ``item.sha256``: ``item`` itself, or the
+        existing row if another session inserted the same content first
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        session.add(item)
+        item.repositories.append(repository)
+        return item
+
+    try:
+        with session.begin_nested():
+            session.add(item)
+    except IntegrityError:
+        existing = session.query(ContentItem).filter_by(sha256=item.sha256).one()
+        if repository not in existing.repositories:
+            existing.repositories.append(repository)
+        return existing
+
+    item.repositories.append(repository)
+    return item
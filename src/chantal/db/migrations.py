@@ -7,6 +7,7 @@ This module provides programmatic access to Alembic operations for database
 schema management.
 """
 
+import functools
 from pathlib import Path
 
 from alembic.config import Config
@@ -17,28 +18,53 @@ from sqlalchemy import create_engine, inspect
 from alembic import command
 
 
-def get_alembic_config(database_url: str) -> Config:
-    """Get Alembic configuration.
-
-    Args:
-        database_url: SQLAlchemy database URL
+def _find_alembic_ini() -> Path:
+    """Locate alembic.ini relative to this file.
 
     Returns:
-        Alembic Config object
+        Path to alembic.ini
+
+    Raises:
+        FileNotFoundError: If alembic.ini does not exist
     """
-    # Find alembic.ini relative to this file
     project_root = Path(__file__).parent.parent.parent.parent
     alembic_ini = project_root / "alembic.ini"
 
     if not alembic_ini.exists():
         raise FileNotFoundError(f"alembic.ini not found at {alembic_ini}")
 
-    config = Config(str(alembic_ini))
+    return alembic_ini
+
+
+def get_alembic_config(database_url: str) -> Config:
+    """Get Alembic configuration.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Alembic Config object
+    """
+    config = Config(str(_find_alembic_ini()))
     config.set_main_option("sqlalchemy.url", database_url)
 
     return config
 
 
+@functools.cache
+def _get_script_directory() -> ScriptDirectory:
+    """Get the Alembic script directory, loaded once per process.
+
+    Loading it imports every migration script. The scripts do not depend on the
+    database URL and do not change while the CLI runs, so all revision lookups
+    share one instance.
+
+    Returns:
+        Alembic ScriptDirectory
+    """
+    return ScriptDirectory.from_config(Config(str(_find_alembic_ini())))
+
+
 def get_current_revision(database_url: str) -> str | None:
     """Get current database schema revision.
 
@@ -50,17 +76,20 @@ def get_current_revision(database_url: str) -> str | None:
     """
     try:
         engine = create_engine(database_url)
+    except Exception:
+        return None
 
-        # Check if alembic_version table exists
-        inspector = inspect(engine)
-        if "alembic_version" not in inspector.get_table_names():
-            return None
-
+    try:
         with engine.connect() as conn:
+            # Check if alembic_version table exists
+            if not inspect(conn).has_table("alembic_version"):
+                return None
             context = MigrationContext.configure(conn)
             return context.get_current_revision()
     except Exception:
         return None
+    finally:
+        engine.dispose()
 
 
 def get_head_revision(database_url: str) -> str:
@@ -72,8 +101,7 @@ def get_head_revision(database_url: str) -> str:
     Returns:
         Latest revision hash
     """
-    config = get_alembic_config(database_url)
-    script = ScriptDirectory.from_config(config)
+    script = _get_script_directory()
     head = script.get_current_head()
     return head if head is not None else ""
 
@@ -88,8 +116,7 @@ def get_pending_migrations(database_url: str) -> list[tuple[str, str]]:
         List of (revision, message) tuples for pending migrations
     """
     current = get_current_revision(database_url)
-    config = get_alembic_config(database_url)
-    script = ScriptDirectory.from_config(config)
+    script = _get_script_directory()
 
     pending = []
 
@@ -118,34 +145,19 @@ def get_migration_history(database_url: str) -> list[tuple[str, str, bool]]:
         List of (revision, message, is_applied) tuples
     """
     current = get_current_revision(database_url)
-    config = get_alembic_config(database_url)
-    script = ScriptDirectory.from_config(config)
-
-    # Get all revisions using iterate_revisions (oldest to newest)
-    history = []
-    for rev in script.iterate_revisions("heads", "base"):
-        if current is None:
-            # No migrations applied yet
-            is_applied = False
-        else:
-            # Check if this revision is the current one or comes before it
-            # We'll mark it as applied if it appears in the chain up to current
-            try:
-                # Try to walk from current to this revision
-                # If we can reach it, it's been applied
-                for check_rev in script.walk_revisions(current, rev.revision):
-                    if check_rev.revision == rev.revision:
-                        is_applied = True
-                        break
-                else:
-                    is_applied = False
-            except Exception:
-                # If walk fails, check if it's exactly current
-                is_applied = rev.revision == current
-
-        history.append((rev.revision, rev.doc or "", is_applied))
-
-    return history
+    script = _get_script_directory()
+
+    # Applied = the current revision and everything below it, collected in one
+    # walk instead of probing the graph once per revision.
+    applied: set[str] = set()
+    if current is not None:
+        applied = {rev.revision for rev in script.iterate_revisions(current, "base")}
+
+    # Newest first
+    return [
+        (rev.revision, rev.doc or "", rev.revision in applied)
+        for rev in script.iterate_revisions("heads", "base")
+    ]
 
 
 def db_needs_upgrade(database_url: str) -> bool:
@@ -209,8 +221,7 @@ def get_revision_info(database_url: str, revision: str) -> tuple[str, str] | Non
     Returns:
         Tuple of (full_revision, message) or None if not found
     """
-    config = get_alembic_config(database_url)
-    script = ScriptDirectory.from_config(config)
+    script = _get_script_directory()
 
     try:
         rev = script.get_revision(revision)
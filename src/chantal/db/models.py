@@ -25,6 +25,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -197,7 +198,10 @@ class ContentItem(Base):
         "Snapshot", secondary=snapshot_content_items, back_populates="content_items"
     )
 
-    # Composite indexes for common queries
+    # Composite indexes for common queries. On PostgreSQL, migration
+    # e5f6a7b8c9d0 also adds pg_trgm GIN indexes on name and version for the
+    # infix ILIKE used by `content search` (skipped if pg_trgm is unavailable,
+    # so they are not declared here).
     __table_args__ = (
         Index("idx_content_type_name", "content_type", "name"),
         Index("idx_content_type_name_version", "content_type", "name", "version"),
@@ -384,8 +388,10 @@ class ViewRepository(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     view_id: Mapped[int] = mapped_column(Integer, ForeignKey("views.id"), nullable=False)
+    # Indexed for reverse lookups ("which views contain this repository");
+    # view_id is already covered as the leading column of uq_view_repository.
     repository_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("repositories.id"), nullable=False
+        Integer, ForeignKey("repositories.id"), nullable=False, index=True
     )
 
     # Order/precedence for metadata merging (lower = higher priority)
@@ -415,7 +421,9 @@ class ViewSnapshot(Base):
     __tablename__ = "view_snapshots"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    view_id: Mapped[int] = mapped_column(Integer, ForeignKey("views.id"), nullable=False)
+    view_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("views.id"), nullable=False, index=True
+    )
 
     # Snapshot identification
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -426,7 +434,10 @@ class ViewSnapshot(Base):
 
     # Which repository snapshots are included (JSON array of snapshot IDs)
     # Example: [12, 45, 67] - references Snapshot.id
-    snapshot_ids: Mapped[list[int]] = mapped_column(JSON, nullable=False)
+    # Stored as binary JSONB on PostgreSQL so containment (@>) can use a GIN index.
+    snapshot_ids: Mapped[list[int]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False
+    )
 
     # Publishing status
     is_published: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -441,7 +452,12 @@ class ViewSnapshot(Base):
     view: Mapped[View] = relationship("View", back_populates="view_snapshots")
 
     # Unique constraint: snapshot name must be unique per view
-    __table_args__ = (UniqueConstraint("view_id", "name", name="uq_view_snapshot_name"),)
+    __table_args__ = (
+        UniqueConstraint("view_id", "name", name="uq_view_snapshot_name"),
+        Index("ix_view_snapshots_snapshot_ids", "snapshot_ids", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<ViewSnapshot(name='{self.name}', view_id={self.view_id}, snapshots={len(self.snapshot_ids)})>"
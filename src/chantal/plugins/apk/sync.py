@@ -7,6 +7,7 @@ This module implements syncing for Alpine APK repositories.
 """
 
 import logging
+import re
 import tarfile
 import tempfile
 from pathlib import Path
@@ -18,6 +19,7 @@ from chantal.core.config import ProxyConfig, RepositoryConfig, SSLConfig
 from chantal.core.downloader import DownloadManager
 from chantal.core.output import OutputLevel, SyncOutputter
 from chantal.core.storage import StorageManager
+from chantal.db.content import add_content_item
 from chantal.db.models import ContentItem, Repository, RepositoryFile
 from chantal.plugins.apk.checksum import compute_apk_control_checksum
 from chantal.plugins.apk.models import ApkMetadata
@@ -248,10 +250,11 @@ class ApkSyncer:
                     content_type="apk",
                     content_metadata=metadata.model_dump(mode="json"),
                 )
-                content_item.repositories.append(repository)
-
-                session.add(content_item)
-                inserted_by_sha[sha256] = content_item
+                inserted_by_sha[sha256] = add_content_item(session, content_item, repository)
+                # Commit each new item right away: with parallel syncs an
+                # uncommitted row would make other workers inserting the same
+                # content wait for this whole sync (or deadlock).
+                session.commit()
                 stats["packages_added"] += 1
                 stats["bytes_downloaded"] += size
 
@@ -400,8 +403,6 @@ class ApkSyncer:
         # Pattern filters
         if config.filters and config.filters.patterns:
             if config.filters.patterns.include:
-                import re
-
                 include_patterns = [re.compile(p) for p in config.filters.patterns.include]
                 filtered = [
                     p
@@ -410,8 +411,6 @@ class ApkSyncer:
                 ]
 
             if config.filters.patterns.exclude:
-                import re
-
                 exclude_patterns = [re.compile(p) for p in config.filters.patterns.exclude]
                 filtered = [
                     p
@@ -8,6 +8,7 @@ Supports mirror mode (1:1 copy with all metadata and GPG signatures preserved).
 """
 
 import logging
+import re
 import tempfile
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -21,6 +22,7 @@ from chantal.core.config import ProxyConfig, RepositoryConfig, SSLConfig
 from chantal.core.downloader import DownloadManager
 from chantal.core.output import OutputLevel, SyncOutputter
 from chantal.core.storage import StorageManager
+from chantal.db.content import add_content_item
 from chantal.db.models import ContentItem, Repository, RepositoryFile
 from chantal.plugins.apt.models import DebMetadata, SourcesMetadata
 from chantal.plugins.apt.parsers import (
@@ -930,11 +932,7 @@ class AptSyncPlugin:
                     filename=filename,
                     content_metadata=pkg_meta.model_dump(exclude_none=False),
                 )
-                session.add(content_item)
-                session.commit()
-
-                # Link content item to repository
-                content_item.repositories.append(repository)
+                content_item = add_content_item(session, content_item, repository)
                 session.commit()
 
                 return bytes_downloaded, content_item
@@ -1124,8 +1122,6 @@ class AptSyncPlugin:
         # Pattern filters (include/exclude by package name)
         if config.filters.patterns:
             if config.filters.patterns.include:
-                import re
-
                 include_patterns = [re.compile(p) for p in config.filters.patterns.include]
                 filtered = [
                     p
@@ -1134,8 +1130,6 @@ class AptSyncPlugin:
                 ]
 
             if config.filters.patterns.exclude:
-                import re
-
                 exclude_patterns = [re.compile(p) for p in config.filters.patterns.exclude]
                 filtered = [
                     p
@@ -1342,15 +1336,11 @@ class AptSyncPlugin:
 
         if config.filters.patterns:
             if config.filters.patterns.include:
-                import re
-
                 include_patterns = [re.compile(p) for p in config.filters.patterns.include]
                 filtered = [
                     s for s in filtered if any(p.match(s.package) for p in include_patterns)
                 ]
             if config.filters.patterns.exclude:
-                import re
-
                 exclude_patterns = [re.compile(p) for p in config.filters.patterns.exclude]
                 filtered = [
                     s for s in filtered if not any(p.match(s.package) for p in exclude_patterns)
@@ -1416,10 +1406,7 @@ class AptSyncPlugin:
                     filename=filename,
                     content_metadata=content_metadata,
                 )
-                session.add(content_item)
-                session.commit()
-
-                content_item.repositories.append(repository)
+                content_item = add_content_item(session, content_item, repository)
                 session.commit()
 
                 return bytes_downloaded, content_item
@@ -7,6 +7,7 @@ This module implements syncing for Helm chart repositories.
 """
 
 import logging
+import re
 import subprocess
 import tempfile
 from pathlib import Path
@@ -20,11 +21,16 @@ from chantal.core.config import ProxyConfig, RepositoryConfig, SSLConfig
 from chantal.core.downloader import DownloadManager
 from chantal.core.output import OutputLevel, SyncOutputter
 from chantal.core.storage import StorageManager
+from chantal.db.content import add_content_item
 from chantal.db.models import ContentItem, Repository, RepositoryFile
 from chantal.plugins.helm.models import HelmMetadata
 
 logger = logging.getLogger(__name__)
 
+# Control characters YAML does not allow; tab (\x09), newline (\x0A) and
+# carriage return (\x0D) are kept. Compiled once, applied to every index.yaml.
+_YAML_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]")
+
 
 def normalize_digest(digest: str | None) -> str | None:
     """Return the bare hex of a chart digest, stripping an optional algo prefix.
@@ -236,10 +242,11 @@ class HelmSyncer:
                     content_type="helm",
                     content_metadata=metadata.model_dump(mode="json"),
                 )
-                content_item.repositories.append(repository)
-
-                session.add(content_item)
-                inserted_by_sha[sha256] = content_item
+                inserted_by_sha[sha256] = add_content_item(session, content_item, repository)
+                # Commit each new item right away: with parallel syncs an
+                # uncommitted row would make other workers inserting the same
+                # content wait for this whole sync (or deadlock).
+                session.commit()
                 stats["charts_added"] += 1
                 stats["bytes_downloaded"] += size
 
@@ -292,10 +299,7 @@ class HelmSyncer:
             content = response.content.decode("latin-1")
 
         # Remove control characters that YAML doesn't allow
-        # Keep tab (\x09), newline (\x0A), carriage return (\x0D)
-        import re
-
-        content = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]", "", content)
+        content = _YAML_CONTROL_CHARS_RE.sub("", content)
 
         result: dict[str, Any] = yaml.safe_load(content)
         return result
@@ -432,8 +436,6 @@ class HelmSyncer:
         # Pattern filters
         if config.filters and config.filters.patterns:
             if config.filters.patterns.include:
-                import re
-
                 include_patterns = [re.compile(p) for p in config.filters.patterns.include]
                 filtered = [
                     c
@@ -442,8 +444,6 @@ class HelmSyncer:
                 ]
 
             if config.filters.patterns.exclude:
-                import re
-
                 exclude_patterns = [re.compile(p) for p in config.filters.patterns.exclude]
                 filtered = [
                     c
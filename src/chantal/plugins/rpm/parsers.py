@@ -74,10 +74,8 @@ def verify_file_checksum(path: Path, checksum_type: str | None, expected: str) -
     """
     if not expected:
         raise ValueError("Cannot verify: empty expected checksum")
-    digest = hashlib.new(normalize_checksum_type(checksum_type))
     with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-            digest.update(chunk)
+        digest = hashlib.file_digest(fh, normalize_checksum_type(checksum_type))
     return digest.hexdigest().lower() == expected.lower()
 
 
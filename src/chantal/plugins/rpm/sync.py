@@ -23,6 +23,7 @@ from chantal.core.downloader import DownloadManager
 from chantal.core.gpg_verify import SignatureVerificationError
 from chantal.core.output import OutputLevel, SyncOutputter
 from chantal.core.storage import StorageManager
+from chantal.db.content import add_content_item
 from chantal.db.models import ContentItem, Repository, RepositoryFile
 from chantal.plugins.rpm import filters, parsers
 from chantal.plugins.rpm.models import RpmMetadata
@@ -835,11 +836,7 @@ class RpmSyncPlugin:
                     filename=filename,
                     content_metadata=rpm_metadata.model_dump(exclude_none=False),
                 )
-                session.add(content_item)
-                session.commit()
-
-                # Link content item to repository
-                content_item.repositories.append(repository)
+                add_content_item(session, content_item, repository)
                 session.commit()
 
                 return bytes_downloaded
@@ -1061,12 +1058,7 @@ class RpmSyncPlugin:
             tmp_file_path = tmp_file.name
 
             # Calculate SHA256
-            sha256_hash = hashlib.sha256()
-            with open(tmp_file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    sha256_hash.update(chunk)
-
-            actual_sha256 = sha256_hash.hexdigest()
+            actual_sha256 = self.storage.calculate_sha256(Path(tmp_file_path))
 
             # Verify checksum if provided
             if expected_sha256 and actual_sha256 != expected_sha256:
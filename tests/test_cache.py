@@ -122,8 +122,9 @@ def test_cache_clear_all(cache, temp_cache_dir):
         assert f.exists()
 
     # Clear cache
-    deleted_count = cache.clear()
+    deleted_count, bytes_freed = cache.clear()
     assert deleted_count == 5
+    assert bytes_freed == sum(len(f"Test content {i}".encode()) for i in range(5))
 
     # Verify files are gone
     for f in files_added:
@@ -143,7 +144,7 @@ def test_cache_clear_pattern(cache):
 
     # Clear only files matching pattern
     pattern = f"{checksum1[:8]}*.xml.gz"
-    deleted_count = cache.clear(pattern)
+    deleted_count, _ = cache.clear(pattern)
 
     # At least one file should match the pattern
     assert deleted_count >= 1
@@ -205,8 +206,8 @@ def test_cache_disabled_operations(temp_cache_dir):
     result = cache.put(checksum, content, "primary")
     assert result == Path("/dev/null")
 
-    # clear() returns 0
-    assert cache.clear() == 0
+    # clear() deletes nothing
+    assert cache.clear() == (0, 0)
 
     # stats() returns empty stats
     stats = cache.stats()
@@ -249,3 +250,50 @@ def test_cache_multiple_file_types(cache):
     # Stats should show 4 files
     stats = cache.stats()
     assert stats.total_files == 4
+
+
+def test_cache_list_cli_newest_first(temp_cache_dir):
+    """`chantal cache list` shows checksums newest first and skips other files."""
+    import os
+
+    from click.testing import CliRunner
+
+    from chantal.cli.main import cli
+
+    old, new = "a" * 64, "b" * 64
+    (temp_cache_dir / f"{old}.xml.gz").write_bytes(b"old")
+    (temp_cache_dir / f"{new}.xml.gz").write_bytes(b"new")
+    (temp_cache_dir / f"{old}.parsed.pickle").write_bytes(b"parsed")
+    os.utime(temp_cache_dir / f"{old}.xml.gz", (time.time() - 7200, time.time() - 7200))
+
+    config_path = temp_cache_dir / "config.yaml"
+    config_path.write_text(f"storage:\n  cache_path: {temp_cache_dir}\n")
+
+    result = CliRunner().invoke(cli, ["--config", str(config_path), "cache", "list"])
+
+    assert result.exit_code == 0, result.output
+    rows = [line.split() for line in result.output.splitlines() if line[:1] in ("a", "b")]
+    assert [row[0] for row in rows] == [new, old]
+    assert "pickle" not in result.output
+
+
+def test_cache_clear_cli_force(temp_cache_dir):
+    """`chantal cache clear --force` deletes cache files and reports their size."""
+    from click.testing import CliRunner
+
+    from chantal.cli.main import cli
+
+    (temp_cache_dir / f"{'a' * 64}.xml.gz").write_bytes(b"x" * 2048)
+    (temp_cache_dir / f"{'a' * 64}.parsed.pickle").write_bytes(b"parsed")
+    config_path = temp_cache_dir / "config.yaml"
+    config_path.write_text(f"storage:\n  cache_path: {temp_cache_dir}\n")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["--config", str(config_path), "cache", "clear", "--force"])
+    assert result.exit_code == 0, result.output
+    assert "Files deleted: 1" in result.output
+    assert "Space freed: 0.00 MB" in result.output
+    assert not (temp_cache_dir / f"{'a' * 64}.xml.gz").exists()
+
+    result = runner.invoke(cli, ["--config", str(config_path), "cache", "clear", "--force"])
+    assert "Cache is already empty" in result.output
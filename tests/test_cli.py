@@ -1,8 +1,13 @@
 """Tests for CLI module."""
 
+import subprocess
+import sys
+
+import click
 from click.testing import CliRunner
 
-from chantal.cli.main import cli
+import chantal
+from chantal.cli.main import LAZY_COMMAND_GROUPS, LAZY_COMMAND_HELP, cli
 
 
 def test_cli_version():
@@ -11,6 +16,7 @@ def test_cli_version():
     result = runner.invoke(cli, ["--version"])
     assert result.exit_code == 0
     assert "version" in result.output.lower()
+    assert chantal.__version__ in result.output
 
 
 def test_cli_help():
@@ -163,3 +169,116 @@ def test_db_verify(tmp_path):
     result = runner.invoke(cli, ["--config", str(config_path), "db", "verify"])
     assert result.exit_code == 0, result.output
     assert "integrity" in result.output.lower()
+
+
+def test_command_groups_load_on_demand():
+    """Groups are listed without importing them, and resolve when invoked."""
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from chantal.cli.main import cli\n"
+        "assert 'chantal.cli.repo_commands' not in sys.modules\n"
+        "result = CliRunner().invoke(cli, ['cache', '--help'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "assert 'chantal.cli.cache_commands' in sys.modules\n"
+        "assert 'chantal.cli.repo_commands' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    result = CliRunner().invoke(cli, ["--help"])
+    for group in (
+        "cache",
+        "content",
+        "db",
+        "package",
+        "pool",
+        "publish",
+        "repo",
+        "snapshot",
+        "view",
+    ):
+        assert f"  {group} " in result.output
+
+
+def test_version_does_not_load_config():
+    """--version exits before the configuration subsystem is imported."""
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from chantal.cli.main import cli\n"
+        "result = CliRunner().invoke(cli, ['--version'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "assert 'chantal.core.config' not in sys.modules\n"
+        "assert 'pydantic' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_top_level_help_does_not_import_groups():
+    """The command listing uses LAZY_COMMAND_HELP instead of loading each group."""
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from chantal.cli.main import cli\n"
+        "result = CliRunner().invoke(cli, ['--help'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "assert 'Repository management commands.' in result.output\n"
+        "loaded = [m for m in sys.modules if m.endswith('_commands')]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_help_matches_group_docstrings():
+    """LAZY_COMMAND_HELP stays in sync with the groups' own help text."""
+    ctx = click.Context(cli)
+    assert set(LAZY_COMMAND_HELP) == set(LAZY_COMMAND_GROUPS)
+    for name, short_help in LAZY_COMMAND_HELP.items():
+        group = cli.get_command(ctx, name)
+        assert group is not None and group.help is not None
+        assert group.help.split("\n\n")[0] == short_help
+
+
+def test_config_loaded_only_when_a_command_reads_it(tmp_path):
+    """A broken config file only fails commands that actually use the config."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("repositories: [\n")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["--config", str(config_path), "repo", "sync", "--help"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(cli, ["--config", str(config_path), "schema"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(cli, ["--config", str(config_path), "repo", "list"])
+    assert result.exit_code == 1
+    assert "YAML syntax error" in result.output
+
+
+def test_missing_config_file_reported_when_config_is_used(tmp_path):
+    """A missing --config file is reported by the config loader, not the option type."""
+    missing = tmp_path / "missing.yaml"
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["--config", str(missing), "schema"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(cli, ["--config", str(missing), "repo", "list"])
+    assert result.exit_code == 1
+    assert f"Configuration file not found: {missing}" in result.output
+
+
+def test_repo_and_publish_groups_do_not_import_plugins():
+    """Sync plugins and publishers are imported by the commands that use them."""
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from chantal.cli.main import cli\n"
+        "for group in ('repo', 'publish'):\n"
+        "    result = CliRunner().invoke(cli, [group, '--help'])\n"
+        "    assert result.exit_code == 0, result.output\n"
+        "loaded = [m for m in sys.modules if m.startswith('chantal.plugins.')]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,48 @@
+"""Tests for client certificate (RHEL entitlement) auth in the download manager."""
+
+from __future__ import annotations
+
+from chantal.core.config import AuthConfig, RepositoryConfig
+from chantal.core.downloader import DownloadManager, RequestsBackend
+
+
+def _manager(auth: AuthConfig) -> DownloadManager:
+    config = RepositoryConfig(
+        id="r", name="R", type="rpm", feed="https://cdn.example.com/repo", auth=auth
+    )
+    return DownloadManager(config=config)
+
+
+def test_cert_dir_pairs_certificate_with_key(tmp_path):
+    (tmp_path / "123-key.pem").write_text("key")
+    (tmp_path / "123.pem").write_text("cert")
+    (tmp_path / "README").write_text("not a pem")
+
+    mgr = _manager(AuthConfig(type="client_cert", cert_dir=str(tmp_path)))
+
+    assert mgr.session.cert == (str(tmp_path / "123.pem"), str(tmp_path / "123-key.pem"))
+
+
+def test_cert_dir_skips_certificate_without_key(tmp_path):
+    (tmp_path / "111.pem").write_text("orphan cert")
+    (tmp_path / "222.pem").write_text("cert")
+    (tmp_path / "222-key.pem").write_text("key")
+
+    assert RequestsBackend._find_entitlement_cert(tmp_path) == (
+        tmp_path / "222.pem",
+        tmp_path / "222-key.pem",
+    )
+
+
+def test_cert_dir_without_key_leaves_session_unauthenticated(tmp_path):
+    (tmp_path / "123.pem").write_text("cert")
+
+    mgr = _manager(AuthConfig(type="client_cert", cert_dir=str(tmp_path)))
+
+    assert mgr.session.cert is None
+    assert RequestsBackend._find_entitlement_cert(tmp_path) == (tmp_path / "123.pem", None)
+
+
+def test_missing_cert_dir(tmp_path):
+    assert RequestsBackend._find_entitlement_cert(tmp_path / "missing") is None
+    assert RequestsBackend._find_entitlement_cert(tmp_path) is None
@@ -0,0 +1,205 @@
+"""Tests for the `chantal content` commands against a seeded SQLite database."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+import yaml
+from click.testing import CliRunner
+
+from chantal.cli.content_commands import _glob_to_like
+from chantal.cli.main import cli
+from chantal.db.connection import DatabaseManager
+from chantal.db.models import Base, ContentItem, Repository
+
+
+def _item(name: str, version: str, content_type: str = "rpm") -> ContentItem:
+    sha256 = hashlib.sha256(f"{name}-{version}".encode()).hexdigest()
+    return ContentItem(
+        content_type=content_type,
+        name=name,
+        version=version,
+        sha256=sha256,
+        size_bytes=1024,
+        pool_path=f"{sha256[:2]}/{sha256[2:4]}/{name}-{version}",
+        filename=f"{name}-{version}.{content_type}",
+        content_metadata={"arch": "x86_64", "release": "1"} if content_type == "rpm" else {},
+    )
+
+
+def _setup(tmp_path) -> str:
+    """Seed two repositories and return the path of a config that uses them."""
+    db_url = f"sqlite:///{tmp_path / 'chantal.db'}"
+    dbm = DatabaseManager(db_url)
+    Base.metadata.create_all(dbm.engine)
+    with dbm.session() as session:
+        base = Repository(repo_id="base", name="Base", type="rpm", feed="http://x", mode="MIRROR")
+        extra = Repository(
+            repo_id="extra", name="Extra", type="rpm", feed="http://y", mode="MIRROR"
+        )
+        shared = _item("shared", "1.0")
+        base.content_items.extend([_item("nginx", "1.20"), _item("nginx", "1.22"), shared])
+        extra.content_items.extend([_item("redis", "7.0"), shared])
+        session.add_all([base, extra, Repository(repo_id="empty", name="E", type="helm", feed="x")])
+
+    config = {
+        "database": {"url": db_url},
+        "repositories": [
+            {"id": "base", "name": "Base", "type": "rpm", "feed": "http://x"},
+            {"id": "extra", "name": "Extra", "type": "rpm", "feed": "http://y"},
+        ],
+        "views": [{"name": "both", "repos": ["base", "extra"]}],
+    }
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(config))
+    return str(config_path)
+
+
+def _json(config_path: str, *args: str) -> list[dict]:
+    result = CliRunner().invoke(cli, ["--config", config_path, "content", *args])
+    assert result.exit_code == 0, result.output
+    return json.loads(result.stdout)
+
+
+def test_content_list_scopes(tmp_path):
+    cfg = _setup(tmp_path)
+
+    items = _json(cfg, "list", "--repo-id", "extra", "--format", "json")
+    assert sorted(i["name"] for i in items) == ["redis", "shared"]
+    assert {(i["arch"], i["release"]) for i in items} == {("x86_64", "1")}
+
+    # An item shared by two repositories in the view is listed once
+    items = _json(cfg, "list", "--view", "both", "--format", "json")
+    assert sorted(i["name"] for i in items) == ["nginx", "nginx", "redis", "shared"]
+
+    assert _json(cfg, "list", "--type", "helm", "--format", "json") == []
+
+
+def test_content_list_limit(tmp_path):
+    cfg = _setup(tmp_path)
+
+    assert len(_json(cfg, "list", "--limit", "2", "--format", "json")) == 2
+    assert len(_json(cfg, "list", "--repo-id", "base", "--limit", "1", "--format", "json")) == 1
+
+
+def test_content_search_lists_repositories(tmp_path):
+    cfg = _setup(tmp_path)
+
+    items = _json(cfg, "search", "shar", "--format", "json")
+    assert [sorted(i["repositories"]) for i in items] == [["base", "extra"]]
+    assert len(_json(cfg, "search", "*", "--limit", "3", "--format", "json")) == 3
+
+
+def test_content_search_json_reports_truncation_on_stderr(tmp_path):
+    cfg = _setup(tmp_path)
+    runner = CliRunner()
+
+    args = ["--config", cfg, "content", "search", "*", "--format", "json"]
+    result = runner.invoke(cli, [*args, "--limit", "3"])
+    assert result.exit_code == 0, result.output
+    assert len(json.loads(result.stdout)) == 3
+    assert "Showing the first 3 matches. Use --limit to show more." in result.stderr
+
+    result = runner.invoke(cli, [*args, "--limit", "10"])
+    assert len(json.loads(result.stdout)) == 4
+    assert result.stderr == ""
+
+
+def test_content_show_by_name(tmp_path):
+    cfg = _setup(tmp_path)
+
+    items = _json(cfg, "show", "nginx", "--format", "json")
+    assert sorted(i["version"] for i in items) == ["1.20", "1.22"]
+    assert all(i["repositories"] == ["base"] and i["snapshots"] == [] for i in items)
+
+
+def test_content_show_by_sha256_any_case(tmp_path):
+    cfg = _setup(tmp_path)
+    sha256 = _json(cfg, "show", "redis", "--format", "json")[0]["sha256"]
+
+    assert sha256 != sha256.upper()
+    items = _json(cfg, "show", sha256.upper(), "--format", "json")
+    assert [(i["name"], i["sha256"]) for i in items] == [("redis", sha256)]
+
+
+def test_json_output_matches_indented_dump(tmp_path):
+    cfg = _setup(tmp_path)
+    runner = CliRunner()
+
+    for args in (["list", "--repo-id", "base"], ["search", "nginx"], ["show", "redis"]):
+        result = runner.invoke(cli, ["--config", cfg, "content", *args, "--format", "json"])
+        assert result.exit_code == 0, result.output
+        assert result.output == json.dumps(json.loads(result.output), indent=2) + "\n"
+
+    result = runner.invoke(
+        cli, ["--config", cfg, "content", "list", "--type", "apt", "--format", "json"]
+    )
+    assert result.output == "[]\n"
+
+
+def test_content_list_table_and_csv(tmp_path):
+    cfg = _setup(tmp_path)
+    runner = CliRunner()
+
+    table = runner.invoke(cli, ["--config", cfg, "content", "list", "--repo-id", "extra"])
+    assert table.exit_code == 0, table.output
+    assert any(
+        line.split()[:4] == ["redis", "7.0", "rpm", "x86_64"] for line in table.output.splitlines()
+    )
+
+    csv_out = runner.invoke(
+        cli, ["--config", cfg, "content", "list", "--format", "csv", "--repo-id", "extra"]
+    )
+    assert csv_out.exit_code == 0, csv_out.output
+    assert "redis,7.0,rpm,x86_64,1024," in csv_out.output
+
+
+def test_content_search_table(tmp_path):
+    cfg = _setup(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["--config", cfg, "content", "search", "nginx"])
+    assert result.exit_code == 0, result.output
+    assert result.output.count("base ") == 2
+    assert "Found: 2 item(s)" in result.output
+
+    result = runner.invoke(cli, ["--config", cfg, "content", "search", "nothing-like-this"])
+    assert "No content found." in result.output
+    assert "Repository" not in result.output
+
+
+def test_glob_to_like():
+    assert _glob_to_like("nginx") == "%nginx%"
+    assert _glob_to_like("py*3") == "%py%3%"
+    assert _glob_to_like("a**b") == "%a%b%"
+    assert _glob_to_like("foo_bar%") == r"%foo\_bar\%%"
+    assert _glob_to_like("*") is None
+    assert _glob_to_like("") is None
+
+
+def test_content_search_underscore_is_literal(tmp_path):
+    cfg = _setup(tmp_path)
+
+    # "_" used to act as a single-character SQL wildcard and matched "nginx"
+    assert _json(cfg, "search", "ngin_", "--format", "json") == []
+    assert len(_json(cfg, "search", "*", "--format", "json")) == 4
+
+
+def test_content_search_in_view(tmp_path):
+    cfg = _setup(tmp_path)
+
+    items = _json(cfg, "search", "*", "--view", "both", "--format", "json")
+    assert sorted(i["name"] for i in items) == ["nginx", "nginx", "redis", "shared"]
+
+
+def test_content_list_total_beyond_limit(tmp_path):
+    cfg = _setup(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["--config", cfg, "content", "list", "--limit", "2"])
+    assert result.exit_code == 0, result.output
+    assert "Total: 2 of 4 item(s)" in result.output
+
+    result = runner.invoke(cli, ["--config", cfg, "content", "list", "--repo-id", "extra"])
+    assert "Total: 2 item(s)" in result.output
@@ -53,6 +53,8 @@ def _seed_orphan(db_url: str) -> int:
         original_path="repodata/primary.xml.gz",
         file_metadata={},
     )
+    repo.content_items.append(item)
+    repo.repository_files.append(rf)
     snap = Snapshot(repository_id=repo.id, name="snap-1")
     snap.content_items.append(item)
     snap.repository_files.append(rf)
@@ -84,6 +86,9 @@ def test_db_cleanup_orphaned_clears_snapshot_associations(tmp_path):
         cli, ["--config", str(config_path), "db", "cleanup", "--orphaned", "--force"]
     )
     assert result.exit_code == 0, f"cleanup failed:\n{result.output}\n{result.exception}"
+    assert "Deleted 1 repositories" in result.output
+    assert "Deleted 1 snapshots" in result.output
+    assert "Deleted 1 sync history entries" in result.output
 
     # Repo, snapshot and sync history are gone, and crucially no association
     # rows are left dangling for the deleted snapshot.
@@ -97,10 +102,33 @@ def test_db_cleanup_orphaned_clears_snapshot_associations(tmp_path):
                 text(f"SELECT COUNT(*) FROM {assoc} WHERE snapshot_id = :sid"), {"sid": snap_id}
             ).scalar()
             assert rows == 0, f"orphaned rows left in {assoc}"
+        for assoc in ("repository_content_items", "repository_repository_files"):
+            rows = session.execute(text(f"SELECT COUNT(*) FROM {assoc}")).scalar()
+            assert rows == 0, f"orphaned rows left in {assoc}"
     finally:
         session.close()
 
 
+def test_db_orphaned_and_dry_run_report_per_repo_counts(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'chantal.db'}"
+    _seed_orphan(db_url)
+    config_path = _config(tmp_path, db_url)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["--config", config_path, "db", "orphaned"])
+    assert result.exit_code == 0, result.output
+    row = next(line for line in result.output.splitlines() if line.startswith("orphan "))
+    assert row.split()[-2:] == ["1", "1"]  # syncs, snapshots
+
+    result = runner.invoke(
+        cli, ["--config", config_path, "db", "cleanup", "--orphaned", "--dry-run"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "orphan (rpm, 1 syncs, 1 snapshots)" in result.output
+    assert "Would delete 1 snapshots" in result.output
+    assert "Would delete 1 sync history entries" in result.output
+
+
 def _config(tmp_path, db_url, repositories=None):
     cfg = {
         "database": {"url": db_url},
@@ -184,7 +212,7 @@ def test_cleanup_unreferenced_dry_run_deletes_nothing(tmp_path):
         cli, ["--config", cfg, "db", "cleanup", "--unreferenced", "--dry-run"]
     )
     assert result.exit_code == 0, result.output
-    assert "Would delete 1 unreferenced packages" in result.output
+    assert "Would delete 1 unreferenced packages (at least 200 B)" in result.output
     session = DatabaseManager(db_url).get_session()
     try:
         assert session.query(ContentItem).count() == 2  # nothing deleted
@@ -230,3 +258,35 @@ def test_cleanup_unreferenced_confirmation_abort(tmp_path):
         assert session.query(ContentItem).count() == 2  # nothing deleted
     finally:
         session.close()
+
+
+def test_configured_repositories_are_not_orphaned(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'chantal.db'}"
+    _seed_orphan(db_url)
+    session = DatabaseManager(db_url).get_session()
+    session.add(Repository(repo_id="keep", name="K", type="rpm", feed="http://x", mode="MIRROR"))
+    session.commit()
+    session.close()
+    cfg = _config(
+        tmp_path,
+        db_url,
+        repositories=[{"id": "keep", "name": "K", "type": "rpm", "feed": "http://x"}],
+    )
+
+    result = CliRunner().invoke(cli, ["--config", cfg, "db", "verify"])
+    assert result.exit_code == 0, result.output
+    assert "Found 1 orphaned repositories" in result.output
+    assert "- orphan (rpm)" in result.output
+    assert "- keep" not in result.output
+    assert "Repositories in config: 1" in result.output
+    assert "Repositories in database: 2" in result.output
+
+
+def test_read_session_uses_autocommit_connection(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'chantal.db'}"
+    _seed_orphan(db_url)
+
+    with DatabaseManager(db_url).read_session() as session:
+        assert session.query(Repository).count() == 1
+        conn = session.connection()
+        assert conn.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
@@ -0,0 +1,97 @@
+"""Tests for race-safe content item insertion (chantal.db.content)."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import func, select
+
+from chantal.db.connection import DatabaseManager
+from chantal.db.content import add_content_item
+from chantal.db.models import Base, ContentItem, Repository, repository_content_items
+
+SHA = "ab" * 32
+
+
+def _item() -> ContentItem:
+    return ContentItem(
+        content_type="rpm",
+        name="demo",
+        version="1.0",
+        sha256=SHA,
+        size_bytes=1,
+        pool_path="ab/ab/demo.rpm",
+        filename="demo.rpm",
+        content_metadata={},
+    )
+
+
+def _repo(repo_id: str) -> Repository:
+    return Repository(repo_id=repo_id, name=repo_id, type="rpm", feed="http://x", mode="MIRROR")
+
+
+@pytest.fixture
+def dbm(tmp_path, monkeypatch):
+    dbm = DatabaseManager(f"sqlite:///{tmp_path / 'chantal.db'}")
+    Base.metadata.create_all(dbm.engine)
+    with dbm.session() as session:
+        session.add_all([_repo("a"), _repo("b")])
+    # Take the savepoint path used on PostgreSQL (SQLite adds directly).
+    monkeypatch.setattr(dbm.engine.dialect, "name", "postgresql")
+    return dbm
+
+
+def _insert_concurrently(dbm: DatabaseManager, linked_to: str) -> None:
+    """Commit the same content from another session, as a parallel worker would."""
+    with dbm.session() as other:
+        item = _item()
+        item.repositories.append(other.query(Repository).filter_by(repo_id=linked_to).one())
+        other.add(item)
+
+
+def _link_count(session, repository: Repository) -> int:
+    return session.scalar(
+        select(func.count())
+        .select_from(repository_content_items)
+        .where(repository_content_items.c.repository_id == repository.id)
+    )
+
+
+def test_conflicting_insert_links_the_existing_row(dbm):
+    session = dbm.get_session()
+    repo_b = session.query(Repository).filter_by(repo_id="b").one()
+    session.add(_repo("c"))  # pending work in the same transaction must survive
+    _insert_concurrently(dbm, linked_to="a")
+
+    result = add_content_item(session, _item(), repo_b)
+    session.commit()
+
+    assert session.query(ContentItem).count() == 1
+    assert result is session.query(ContentItem).one()
+    assert sorted(repo.repo_id for repo in result.repositories) == ["a", "b"]
+    assert session.query(Repository).filter_by(repo_id="c").count() == 1
+    session.close()
+
+
+def test_conflicting_insert_does_not_link_twice(dbm):
+    session = dbm.get_session()
+    repo_b = session.query(Repository).filter_by(repo_id="b").one()
+    _insert_concurrently(dbm, linked_to="b")
+
+    result = add_content_item(session, _item(), repo_b)
+    session.commit()
+
+    assert [repo.repo_id for repo in result.repositories] == ["b"]
+    assert _link_count(session, repo_b) == 1
+    session.close()
+
+
+def test_new_item_is_added_and_linked(dbm):
+    session = dbm.get_session()
+    repo_a = session.query(Repository).filter_by(repo_id="a").one()
+    item = _item()
+
+    assert add_content_item(session, item, repo_a) is item
+    session.commit()
+
+    assert _link_count(session, repo_a) == 1
+    session.close()
@@ -540,3 +540,22 @@ def test_repository_file_repr(db_session):
     assert "vmlinuz" in repr_str
     assert "images/pxeboot/vmlinuz" in repr_str
     assert "test1234" in repr_str  # First 8 chars of SHA256
+
+
+def test_view_snapshot_ids_jsonb_on_postgresql_only():
+    """snapshot_ids is JSONB + GIN-indexed on PostgreSQL, plain JSON elsewhere."""
+    from sqlalchemy import inspect
+    from sqlalchemy.dialects import postgresql, sqlite
+    from sqlalchemy.schema import CreateTable
+
+    from chantal.db.models import ViewSnapshot
+
+    table = ViewSnapshot.__table__
+    assert "snapshot_ids JSONB" in str(CreateTable(table).compile(dialect=postgresql.dialect()))
+    assert "snapshot_ids JSON" in str(CreateTable(table).compile(dialect=sqlite.dialect()))
+
+    # The GIN index is only emitted for PostgreSQL.
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("view_snapshots")}
+    assert "ix_view_snapshots_snapshot_ids" not in indexes
@@ -0,0 +1,95 @@
+"""Tests for batched (parallel) downloads in the download manager."""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import requests
+import urllib3.util.connection
+from urllib3.util.retry import Retry
+
+from chantal.core.config import DownloadConfig, RepositoryConfig
+from chantal.core.downloader import DownloadManager, DownloadTask
+
+
+def _manager(parallel: int) -> DownloadManager:
+    config = RepositoryConfig(id="r", name="R", type="rpm", feed="http://upstream.example.com/")
+    return DownloadManager(config=config, download_config=DownloadConfig(parallel=parallel))
+
+
+def test_download_batch_parallel_preserves_task_order(tmp_path, monkeypatch):
+    mgr = _manager(parallel=4)
+    threads: set[int] = set()
+
+    def fake_download(url: str, dest: Path, expected_sha256: str | None = None) -> Path:
+        threads.add(threading.get_ident())
+        # Later tasks finish first, so completion order != task order.
+        time.sleep(0.01 * (5 - int(url.rsplit("/", 1)[1])))
+        return dest
+
+    monkeypatch.setattr(mgr.backend_impl, "download_file", fake_download)
+    tasks = [DownloadTask(url=f"http://x/{i}", dest=tmp_path / f"{i}") for i in range(5)]
+
+    assert mgr.download_batch(tasks) == [t.dest for t in tasks]
+    assert len(threads) > 1
+
+
+def test_download_batch_sequential_by_default(tmp_path, monkeypatch):
+    mgr = _manager(parallel=1)
+    threads: set[int] = set()
+
+    def fake_download(url: str, dest: Path, expected_sha256: str | None = None) -> Path:
+        threads.add(threading.get_ident())
+        return dest
+
+    monkeypatch.setattr(mgr.backend_impl, "download_file", fake_download)
+    tasks = [DownloadTask(url=f"http://x/{i}", dest=tmp_path / f"{i}") for i in range(3)]
+
+    assert mgr.download_batch(tasks) == [t.dest for t in tasks]
+    assert threads == {threading.get_ident()}
+
+
+def test_session_pool_sized_for_parallel_downloads():
+    mgr = _manager(parallel=32)
+    adapter = mgr.session.get_adapter("https://upstream.example.com/")
+    assert adapter._pool_maxsize == 32
+
+
+def test_session_retries_connection_errors_only():
+    config = RepositoryConfig(id="r", name="R", type="rpm", feed="http://upstream.example.com/")
+    mgr = DownloadManager(config=config, download_config=DownloadConfig(retry_attempts=2))
+    retries = mgr.session.get_adapter("https://upstream.example.com/").max_retries
+    assert retries.total == 2
+    assert retries.read is False
+    assert retries.backoff_factor > 0
+
+
+def test_unreachable_host_connect_attempts_do_not_multiply(tmp_path, monkeypatch):
+    # A port nothing listens on: every connect attempt is refused.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    attempts = 0
+    create_connection = urllib3.util.connection.create_connection
+
+    def counting_create_connection(*args, **kwargs):
+        nonlocal attempts
+        attempts += 1
+        return create_connection(*args, **kwargs)
+
+    monkeypatch.setattr(urllib3.util.connection, "create_connection", counting_create_connection)
+    monkeypatch.setattr(Retry, "get_backoff_time", lambda self: 0)
+    config = RepositoryConfig(id="r", name="R", type="rpm", feed=f"http://127.0.0.1:{port}/")
+    mgr = DownloadManager(config=config, download_config=DownloadConfig(retry_attempts=2))
+    mgr.session.trust_env = False
+
+    with pytest.raises(requests.ConnectionError):
+        mgr.download_file(f"http://127.0.0.1:{port}/pkg.rpm", tmp_path / "pkg.rpm")
+
+    # The adapter's connect retries only, not multiplied by download_file's loop.
+    assert attempts == 3
@@ -86,6 +86,25 @@ def sample_index_yaml():
     }
 
 
+class TestHelmSyncerFetchIndex:
+    """Tests for HelmSyncer._fetch_index()."""
+
+    def test_fetch_index_strips_yaml_control_characters(self, temp_storage):
+        """Control characters YAML rejects are dropped before parsing."""
+        repo_config = RepositoryConfig(
+            id="test-helm", name="Test", type="helm", feed="https://charts.example.com"
+        )
+        syncer = HelmSyncer(storage=temp_storage, config=repo_config)
+        raw = b"apiVersion: v1\nentries:\n  demo:\n  - name: de\x01mo\x7f\n    version: 1.0.0\n"
+        response = Mock(content=raw)
+        syncer.session = Mock(get=Mock(return_value=response))
+
+        index = syncer._fetch_index("https://charts.example.com/index.yaml", repo_config)
+
+        assert index["entries"]["demo"][0]["name"] == "demo"
+        assert index["entries"]["demo"][0]["version"] == "1.0.0"
+
+
 class TestHelmSyncerIndexStorage:
     """Tests for HelmSyncer._store_index_file()."""
 
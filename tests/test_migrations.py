@@ -78,15 +78,23 @@ def test_get_migration_history(temp_db):
     # Initialize database
     migrations.init_database(temp_db)
 
-    # Get history - just check it doesn't crash
-    # The function works in practice, alembic iteration is complex
-    try:
-        history = migrations.get_migration_history(temp_db)
-        assert isinstance(history, list)
-    except Exception:
-        # If it fails due to alembic complexity, that's OK for now
-        # The manual tests show it works in practice
-        pass
+    history = migrations.get_migration_history(temp_db)
+    assert history
+    assert all(is_applied for _, _, is_applied in history)
+
+
+def test_get_migration_history_partially_applied(temp_db):
+    """Only the current revision and its ancestors are marked applied."""
+    revisions = [rev for rev, _, _ in migrations.get_migration_history(temp_db)]  # newest first
+    middle = len(revisions) // 2
+    migrations.upgrade_database(temp_db, revisions[middle])
+
+    history = migrations.get_migration_history(temp_db)
+
+    assert [rev for rev, _, _ in history] == revisions
+    assert [is_applied for _, _, is_applied in history] == [
+        i >= middle for i in range(len(revisions))
+    ]
 
 
 def test_get_revision_info(temp_db):
@@ -107,3 +115,38 @@ def test_get_revision_info_invalid(temp_db):
     """Test getting revision info for invalid revision."""
     info = migrations.get_revision_info(temp_db, "invalid_revision_hash")
     assert info is None
+
+
+def test_view_foreign_keys_indexed(temp_db):
+    """Migrated schema indexes the view FK columns, matching the models."""
+    from sqlalchemy import create_engine, inspect
+
+    migrations.init_database(temp_db)
+    inspector = inspect(create_engine(temp_db))
+
+    snapshot_indexes = {ix["name"] for ix in inspector.get_indexes("view_snapshots")}
+    repo_indexes = {ix["name"] for ix in inspector.get_indexes("view_repositories")}
+    assert "ix_view_snapshots_view_id" in snapshot_indexes
+    assert "ix_view_repositories_repository_id" in repo_indexes
+
+
+def test_script_directory_loaded_once(temp_db, monkeypatch):
+    """Revision lookups share one ScriptDirectory instead of re-reading the scripts."""
+    calls = []
+    original = migrations.ScriptDirectory.from_config
+
+    def counting_from_config(config):
+        calls.append(config)
+        return original(config)
+
+    migrations._get_script_directory.cache_clear()
+    monkeypatch.setattr(migrations.ScriptDirectory, "from_config", counting_from_config)
+    try:
+        head = migrations.get_head_revision(temp_db)
+        migrations.get_revision_info(temp_db, head)
+        migrations.get_pending_migrations(temp_db)
+        migrations.get_migration_history(temp_db)
+    finally:
+        migrations._get_script_directory.cache_clear()
+
+    assert len(calls) == 1
@@ -134,3 +134,15 @@ def test_pooled_conflict_still_requires_force(session, storage, repository, tmp_
 
     assert _upload_rpm(session, storage, repository, b, force=True) == "replaced"
     assert len(_rpm_items(repository)) == 1
+
+
+@pytest.mark.parametrize("payload", [b"", b"not an rpm at all"])
+def test_non_rpm_upload_rejected(session, storage, repository, tmp_path, payload):
+    from chantal.plugins.rpm.rpm_header import RpmFormatError
+
+    f = tmp_path / "bogus.rpm"
+    f.write_bytes(payload)
+
+    with pytest.raises(RpmFormatError):
+        _upload_rpm(session, storage, repository, f, force=False)
+    assert _rpm_items(repository) == []
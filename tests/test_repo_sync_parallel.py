@@ -0,0 +1,247 @@
+"""Tests for syncing several repositories in parallel (repo sync --workers)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import uuid
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import yaml
+from click.testing import CliRunner
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from chantal.cli import repo_commands
+from chantal.cli.main import cli
+from chantal.db.content import add_content_item
+from chantal.db.models import Base, ContentItem, Repository
+from chantal.plugins.helm import sync as helm_sync
+from chantal.plugins.helm.sync import HelmSyncer
+
+# Parallel syncs need PostgreSQL. Point this at a server where the user may
+# create databases (e.g. postgresql+psycopg2://postgres@localhost/postgres);
+# each test runs in a database of its own that is dropped afterwards.
+_POSTGRES_URL = os.environ.get("CHANTAL_TEST_POSTGRES_URL")
+
+# Not connected to by the tests that fake the sync itself.
+_UNUSED_POSTGRES_URL = "postgresql+psycopg2://chantal@localhost/chantal"
+
+
+def _write_config(tmp_path, repo_ids, database_url=None, repo_type="rpm", feed_base=None):
+    database_url = database_url or f"sqlite:///{tmp_path / 'chantal.db'}"
+    feed_base = feed_base or "https://example.com"
+    repos = "".join(
+        f"  - id: {repo_id}\n    type: {repo_type}\n    feed: {feed_base}/{repo_id}/\n"
+        for repo_id in repo_ids
+    )
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"database:\n  url: {database_url}\n"
+        f"storage:\n  base_path: {tmp_path / 'data'}\n"
+        f"repositories:\n{repos}"
+    )
+    return config_path
+
+
+def test_sync_all_with_workers_runs_repositories_concurrently(tmp_path, monkeypatch):
+    config_path = _write_config(tmp_path, ["a", "b", "bad"], database_url=_UNUSED_POSTGRES_URL)
+    # All three syncs must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(3, timeout=10)
+    synced: list[str] = []
+
+    def fake_sync(session, storage, global_config, repo_config, output_level):
+        barrier.wait()
+        if repo_config.id == "bad":
+            raise RuntimeError("upstream unreachable")
+        synced.append(repo_config.id)
+
+    monkeypatch.setattr(repo_commands, "check_db_schema_version", lambda ctx: None)
+    monkeypatch.setattr(repo_commands, "_sync_single_repository", fake_sync)
+
+    result = CliRunner().invoke(
+        cli, ["--config", str(config_path), "repo", "sync", "--all", "--workers", "3"]
+    )
+
+    assert result.exit_code == 1
+    assert sorted(synced) == ["a", "b"]
+    assert "bad: sync failed: upstream unreachable" in result.output
+    assert "1 of 3 repositories failed to sync: bad" in result.output
+
+
+def test_sync_pattern_without_workers_stays_sequential(tmp_path, monkeypatch):
+    config_path = _write_config(tmp_path, ["epel-a", "epel-b", "other"])
+    threads: set[int] = set()
+    synced: list[str] = []
+
+    def fake_sync(session, storage, global_config, repo_config, output_level):
+        threads.add(threading.get_ident())
+        synced.append(repo_config.id)
+
+    monkeypatch.setattr(repo_commands, "check_db_schema_version", lambda ctx: None)
+    monkeypatch.setattr(repo_commands, "_sync_single_repository", fake_sync)
+
+    result = CliRunner().invoke(
+        cli, ["--config", str(config_path), "repo", "sync", "--pattern", "epel-*"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert synced == ["epel-a", "epel-b"]
+    assert threads == {threading.get_ident()}
+
+
+def test_workers_rejected_on_sqlite(tmp_path, monkeypatch):
+    config_path = _write_config(tmp_path, ["a", "b"])
+    monkeypatch.setattr(repo_commands, "check_db_schema_version", lambda ctx: None)
+    monkeypatch.setattr(
+        repo_commands, "_sync_single_repository", lambda *args: pytest.fail("synced on SQLite")
+    )
+
+    result = CliRunner().invoke(
+        cli, ["--config", str(config_path), "repo", "sync", "--all", "--workers", "2"]
+    )
+
+    assert result.exit_code == 1
+    assert "--workers > 1 requires PostgreSQL" in result.output
+
+
+@pytest.fixture
+def postgres_url() -> Iterator[str]:
+    if not _POSTGRES_URL:
+        pytest.skip("CHANTAL_TEST_POSTGRES_URL not set")
+    name = f"chantal_test_{uuid.uuid4().hex[:12]}"
+    admin = create_engine(_POSTGRES_URL, isolation_level="AUTOCOMMIT")
+    with admin.connect() as conn:
+        conn.exec_driver_sql(f'CREATE DATABASE "{name}"')
+    url = make_url(_POSTGRES_URL).set(database=name)
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    try:
+        yield url.render_as_string(hide_password=False)
+    finally:
+        with admin.connect() as conn:
+            conn.exec_driver_sql(f'DROP DATABASE "{name}" WITH (FORCE)')
+        admin.dispose()
+
+
+@pytest.fixture
+def helm_upstream() -> Iterator[Callable[[dict[str, list[str]]], str]]:
+    """Serve helm repositories over HTTP; call with ``{repo_id: [chart, ...]}``."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.files = {}  # type: ignore[attr-defined]
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def serve(layout: dict[str, list[str]]) -> str:
+        for repo_id, names in layout.items():
+            entries = {}
+            for name in names:
+                data = f"{name} chart".encode()
+                server.files[f"/charts/{name}-1.0.0.tgz"] = data  # type: ignore[attr-defined]
+                entries[name] = [
+                    {
+                        "name": name,
+                        "version": "1.0.0",
+                        "urls": [f"{base}/charts/{name}-1.0.0.tgz"],
+                        "digest": hashlib.sha256(data).hexdigest(),
+                    }
+                ]
+            # Keep the chart order: the syncer processes entries as listed.
+            index = yaml.safe_dump({"apiVersion": "v1", "entries": entries}, sort_keys=False)
+            server.files[f"/{repo_id}/index.yaml"] = index.encode()  # type: ignore[attr-defined]
+        return base
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield serve
+    server.shutdown()
+    server.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        body = self.server.files.get(self.path)  # type: ignore[attr-defined]
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def _sync_in_parallel(tmp_path, monkeypatch, postgres_url, feed_base):
+    config_path = _write_config(
+        tmp_path, ["a", "b"], database_url=postgres_url, repo_type="helm", feed_base=feed_base
+    )
+    monkeypatch.setattr(repo_commands, "check_db_schema_version", lambda ctx: None)
+
+    result = CliRunner().invoke(
+        cli, ["--config", str(config_path), "repo", "sync", "--all", "--workers", "2"]
+    )
+    assert result.exit_code == 0, result.output
+
+    engine = create_engine(postgres_url)
+    try:
+        with Session(engine) as session:
+            shas = [item.sha256 for item in session.query(ContentItem)]
+            assert len(shas) == len(set(shas))
+            return {
+                repo.repo_id: sorted(item.name for item in repo.content_items)
+                for repo in session.query(Repository)
+            }
+    finally:
+        engine.dispose()
+
+
+def test_parallel_sync_of_repositories_sharing_content(
+    tmp_path, monkeypatch, postgres_url, helm_upstream
+):
+    feed_base = helm_upstream({"a": ["shared", "only-a"], "b": ["shared", "only-b"]})
+    # Hold both workers at the shared chart until each has passed the
+    # "already in the pool?" lookup, so both go on to insert it.
+    barrier = threading.Barrier(2, timeout=10)
+    download_chart = HelmSyncer._download_chart
+
+    def racing_download_chart(self, url, config):
+        if "/shared-" in url:
+            barrier.wait()
+        return download_chart(self, url, config)
+
+    monkeypatch.setattr(HelmSyncer, "_download_chart", racing_download_chart)
+
+    linked = _sync_in_parallel(tmp_path, monkeypatch, postgres_url, feed_base)
+
+    assert linked == {"a": ["only-a", "shared"], "b": ["only-b", "shared"]}
+
+
+def test_parallel_sync_of_shared_content_in_opposite_order(
+    tmp_path, monkeypatch, postgres_url, helm_upstream
+):
+    feed_base = helm_upstream({"a": ["one", "two"], "b": ["two", "one"]})
+    # Both workers insert their first chart before either goes on to its second,
+    # which is the other's first. Had each insert stayed uncommitted until the
+    # end of the sync, the workers would wait on each other (a deadlock).
+    barrier = threading.Barrier(2, timeout=10)
+    first_insert_done = threading.local()
+
+    def racing_add_content_item(session, item, repository):
+        result = add_content_item(session, item, repository)
+        if not getattr(first_insert_done, "value", False):
+            first_insert_done.value = True
+            barrier.wait()
+        return result
+
+    monkeypatch.setattr(helm_sync, "add_content_item", racing_add_content_item)
+
+    linked = _sync_in_parallel(tmp_path, monkeypatch, postgres_url, feed_base)
+
+    assert linked == {"a": ["one", "two"], "b": ["one", "two"]}
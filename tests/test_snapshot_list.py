@@ -0,0 +1,83 @@
+"""snapshot list / publish list load snapshot repositories in one query."""
+
+from __future__ import annotations
+
+import json
+
+import yaml
+from click.testing import CliRunner
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from chantal.cli.main import cli
+from chantal.db.connection import DatabaseManager
+from chantal.db.models import Base, Repository, Snapshot
+
+
+def _setup(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'chantal.db'}"
+    dbm = DatabaseManager(db_url)
+    Base.metadata.create_all(dbm.engine)
+    with dbm.session() as session:
+        for i in range(3):
+            repo = Repository(
+                repo_id=f"repo{i}", name=f"R{i}", type="rpm", feed="http://x", mode="MIRROR"
+            )
+            session.add(repo)
+            session.flush()
+            session.add_all(
+                Snapshot(repository_id=repo.id, name=f"snap{j}", is_published=True)
+                for j in range(2)
+            )
+    dbm.engine.dispose()
+
+    cfg = {
+        "database": {"url": db_url},
+        "storage": {"base_path": str(tmp_path / "data")},
+    }
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump(cfg), encoding="utf-8")
+    return str(path)
+
+
+def _invoke_counting_selects(args):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        result = CliRunner().invoke(cli, args)
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+    return result, statements
+
+
+def test_snapshot_list_issues_a_single_select(tmp_path):
+    config = _setup(tmp_path)
+
+    result, statements = _invoke_counting_selects(["--config", config, "snapshot", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert "Total: 6 snapshot(s)" in result.output
+    for i in range(3):
+        assert f"repo{i}" in result.output
+    assert len(statements) == 1
+
+
+def test_publish_list_issues_a_single_select(tmp_path):
+    config = _setup(tmp_path)
+
+    result, statements = _invoke_counting_selects(
+        ["--config", config, "publish", "list", "--format", "json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted({s["repository"] for s in json.loads(result.output)["snapshots"]}) == [
+        "repo0",
+        "repo1",
+        "repo2",
+    ]
+    assert len(statements) == 1
@@ -0,0 +1,147 @@
+"""Tests for the download manager's reusable TLS context (mTLS against a local server)."""
+
+from __future__ import annotations
+
+import datetime
+import ipaddress
+import ssl
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from chantal.core.config import DownloadConfig, RepositoryConfig, SSLConfig
+from chantal.core.downloader import DownloadManager
+
+
+def _issue(
+    tmp_path: Path, name: str, issuer: tuple | None = None, *, ca: bool = False
+) -> tuple[Path, Path, x509.Certificate, ec.EllipticCurvePrivateKey]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, name)])
+    issuer_cert, issuer_key = issuer if issuer else (None, key)
+    now = datetime.datetime.now(datetime.UTC)
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(subject)
+        .issuer_name(issuer_cert.subject if issuer_cert else subject)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=ca, path_length=None), critical=True)
+    )
+    if not ca:
+        builder = builder.add_extension(
+            x509.SubjectAlternativeName(
+                [x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+    cert = builder.sign(issuer_key, hashes.SHA256())
+    cert_path = tmp_path / f"{name}.pem"
+    key_path = tmp_path / f"{name}-key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path, cert, key
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def mtls(tmp_path) -> Iterator[dict]:
+    ca_path, _, ca_cert, ca_key = _issue(tmp_path, "ca", ca=True)
+    server_cert, server_key, _, _ = _issue(tmp_path, "server", (ca_cert, ca_key))
+    client_cert, client_key, _, _ = _issue(tmp_path, "client", (ca_cert, ca_key))
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(server_cert, server_key)
+    context.load_verify_locations(cafile=ca_path)
+    context.verify_mode = ssl.CERT_REQUIRED
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield {
+        "url": f"https://localhost:{server.server_address[1]}/",
+        "ca": str(ca_path),
+        "cert": str(client_cert),
+        "key": str(client_key),
+    }
+    server.shutdown()
+    server.server_close()
+
+
+def _manager(ssl_config: SSLConfig) -> DownloadManager:
+    config = RepositoryConfig(id="r", name="R", type="rpm", feed="https://localhost/")
+    # No connect retries: the failure cases should fail fast.
+    return DownloadManager(
+        config=config, ssl_config=ssl_config, download_config=DownloadConfig(retry_attempts=0)
+    )
+
+
+def test_client_cert_loaded_once_and_reused(mtls):
+    mgr = _manager(
+        SSLConfig(ca_bundle=mtls["ca"], client_cert=mtls["cert"], client_key=mtls["key"])
+    )
+    session = mgr.session
+    session.trust_env = False  # ignore REQUESTS_CA_BUNDLE etc. from the environment
+
+    for _ in range(3):
+        response = session.get(mtls["url"], timeout=10)
+        assert response.text == "ok"
+        response.close()
+
+    adapter = session.get_adapter(mtls["url"])
+    assert list(adapter._ssl_contexts) == [(mtls["ca"], (mtls["cert"], mtls["key"]))]
+    pool = next(iter(adapter.poolmanager.pools._container.values()))
+    assert (
+        pool.conn_kw["ssl_context"]
+        is adapter._ssl_contexts[(mtls["ca"], (mtls["cert"], mtls["key"]))]
+    )
+    assert pool.cert_file is None and pool.ca_certs is None
+
+
+def test_missing_client_cert_is_rejected_by_server(mtls):
+    mgr = _manager(SSLConfig(ca_bundle=mtls["ca"]))
+    mgr.session.trust_env = False
+
+    with pytest.raises(requests.exceptions.RequestException):
+        mgr.session.get(mtls["url"], timeout=10)
+
+
+def test_unreadable_client_cert_falls_back_to_requests_error(mtls, tmp_path):
+    bogus = tmp_path / "bogus.pem"
+    bogus.write_text("not a certificate")
+    mgr = _manager(SSLConfig(ca_bundle=mtls["ca"], client_cert=str(bogus)))
+    mgr.session.trust_env = False
+
+    with pytest.raises(requests.exceptions.SSLError):
+        mgr.session.get(mtls["url"], timeout=10)